@@ -1,13 +1,13 @@
 """Action handler for Stream Deck button presses"""
 
 import logging
-import threading
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from deckky.input_handler import InputHandler
 from deckky.volume_control import VolumeControl
 from deckky.obs_control import OBSControl
 from deckky.homeassistant_control import HomeAssistantControl
 from deckky.dlz_control import DLZControl
+from deckky.scheduler import Scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -15,21 +15,41 @@ logger = logging.getLogger(__name__)
 class ActionHandler:
     """Handles actions triggered by Stream Deck button presses"""
 
-    def __init__(self, config: Dict[str, Any]):
+    # Interval between volume steps while an increase/decrease button is held
+    VOLUME_RAMP_INTERVAL = 0.2
+
+    def __init__(self, config: Dict[str, Any], volume_control: Optional[VolumeControl] = None,
+                 scheduler: Optional[Scheduler] = None):
+        """Create the handler and the integrations the config uses
+
+        Args:
+            config: Configuration dictionary
+            volume_control: Shared VolumeControl to use instead of starting another volume monitor
+            scheduler: Shared Scheduler for volume ramps instead of starting another scheduler thread
+        """
         self.config = config
         self.input_handler = InputHandler()
-        self.volume_control = VolumeControl()
+        self.volume_control = volume_control if volume_control is not None else VolumeControl()
+        if scheduler is None:
+            scheduler = Scheduler()
+            scheduler.start()
+        self.scheduler = scheduler
         self.held_keys = {}
-        self.volume_ramp_threads = {}  # Track volume ramping threads
+        self.volume_ramps = {}  # Active volume ramp of each held button: {button_id: ramp token}
         
-        # Initialize OBS control if configured
+        # Initialize OBS control, connecting only when some button uses it
         obs_config = config.get('obs', {})
         self.obs_control = OBSControl(
             host=obs_config.get('host', 'localhost'),
             port=obs_config.get('port', 4455),
             password=obs_config.get('password', ''),
-            poll_interval=obs_config.get('poll_interval', 1)
+            poll_interval=obs_config.get('poll_interval', 1),
+            autostart=False
         )
+        if self._has_buttons_of_type('obs'):
+            self.obs_control.start()
+        else:
+            logger.debug("No OBS buttons configured, not connecting to OBS")
 
         # Initialize Home Assistant control if configured
         ha_config = config.get('homeassistant', {})
@@ -44,6 +64,15 @@ class ActionHandler:
         dlz_host = config.get('dlz', {}).get('host', 'localhost')
         self.dlz_control = DLZControl(host=dlz_host)
 
+    def _has_buttons_of_type(self, button_type: str) -> bool:
+        """Check whether any configured button has the given type"""
+        for group_config in self.config.get('groups', {}).values():
+            for page_config in group_config.get('pages', {}).values():
+                for button_config in page_config.get('buttons', {}).values():
+                    if button_config.get('type') == button_type:
+                        return True
+        return False
+
     def handle_press(self, button_id: int, button_config: Dict[str, Any]):
         """Handle button press event"""
         action_type = button_config.get('type')
@@ -133,42 +162,30 @@ class ActionHandler:
         # Stop any existing ramp for this button
         self._stop_volume_ramp(button_id)
 
-        # Create stop event for this ramp
-        stop_event = threading.Event()
+        adjust = self.volume_control.increase if action == 'increase' else self.volume_control.decrease
+        token = object()
+        self.volume_ramps[button_id] = token
+        # Keyed by token so a stale step rescheduling itself can't replace a newer ramp's entry
+        key = ('volume_ramp', button_id, token)
 
-        def ramp_volume():
-            # Initial adjustment (immediate feedback)
-            if action == 'increase':
-                self.volume_control.increase(amount)
-            else:
-                self.volume_control.decrease(amount)
-
-            # Continue ramping while button is held
-            while not stop_event.wait(0.2):  # 200ms intervals
-                if action == 'increase':
-                    self.volume_control.increase(amount)
-                else:
-                    self.volume_control.decrease(amount)
-
-        # Start ramping thread
-        ramp_thread = threading.Thread(target=ramp_volume, daemon=True)
-        ramp_thread.start()
-
-        # Store thread and stop event
-        self.volume_ramp_threads[button_id] = {
-            'thread': ramp_thread,
-            'stop_event': stop_event
-        }
+        def ramp_step():
+            # A step already due when the button was released must not reschedule itself
+            if self.volume_ramps.get(button_id) is not token:
+                return
+            adjust(amount)
+            # If released meanwhile, the next step finds the token gone and stops there
+            self.scheduler.schedule(key, self.VOLUME_RAMP_INTERVAL, ramp_step)
+
+        # First step runs right away on the scheduler thread (immediate feedback)
+        self.scheduler.schedule(key, 0, ramp_step)
 
         logger.debug(f"Started volume ramp for button {button_id}: {action}")
 
     def _stop_volume_ramp(self, button_id: int):
         """Stop continuous volume adjustment"""
-        if button_id in self.volume_ramp_threads:
-            ramp_info = self.volume_ramp_threads[button_id]
-            ramp_info['stop_event'].set()
-            ramp_info['thread'].join(timeout=0.5)
-            del self.volume_ramp_threads[button_id]
+        token = self.volume_ramps.pop(button_id, None)
+        if token is not None:
+            self.scheduler.cancel(('volume_ramp', button_id, token))
             logger.debug(f"Stopped volume ramp for button {button_id}")
 
     def _handle_discord(self, button_id: int, config: Dict[str, Any], is_press: bool):
@@ -1,11 +1,32 @@
 """Utility functions for button update operations"""
 
 import logging
-from typing import Dict, Any, Callable
+import threading
+from typing import Dict, Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class KeyImageWriter:
+    """Writes key images to a Stream Deck, skipping writes of the image a key already shows"""
+
+    def __init__(self, deck):
+        self.deck = deck
+        self._last_key_image: Dict[int, bytes] = {}
+        # Keys are written from many threads; the record must match what the deck was last sent
+        self._lock = threading.Lock()
+
+    def set_key_image(self, key: int, image: Optional[bytes]) -> bool:
+        """Set a key image unless the key already shows it. Returns True if the deck was written."""
+        with self._lock:
+            last = self._last_key_image.get(key)
+            if image is not None and (last is image or last == image):
+                return False
+            self.deck.set_key_image(key, image)
+            self._last_key_image[key] = image
+            return True
+
+
 def update_buttons_for_type(
     groups: Dict[str, Any],
     group_pages: Dict[str, int],
@@ -15,12 +36,11 @@ def update_buttons_for_type(
     button_type: str,
     setup_button_func: Callable,
 ) -> int:
-    """Update all buttons of a specific type across all groups. Returns count updated."""
+    """Update all buttons of a specific type across all groups. Returns count of keys written."""
     updated_count = 0
     
     for group_name, group_config in groups.items():
         pages = group_config.get('pages', {})
-        button_range = group_config.get('buttons', [])
         
         current_page = group_pages.get(group_name, 0)
         
@@ -29,18 +49,17 @@ def update_buttons_for_type(
             
         page_config = pages[current_page]
         page_buttons = page_config.get('buttons', {})
+        group_bg_color = group_config.get('bg_color', 'black')
         
-        for button_id, button_config in page_buttons.items():
-            button_num = int(button_id)
-            
+        for button_num, button_config in page_buttons.items():
+            # button_to_group gives O(1) membership instead of scanning the group's button list
             if (button_config.get('type') == button_type and
-                button_num in button_range):
+                button_to_group.get(button_num) == group_name):
                 
-                group_bg_color = group_config.get('bg_color', 'black')
                 image = setup_button_func(button_config, create_image_callback, group_bg_color)
                 
-                if image:
-                    deck.set_key_image(button_num, image)
+                # A KeyImageWriter returns False when the key already shows this image
+                if image and deck.set_key_image(button_num, image) is not False:
                     updated_count += 1
     
     return updated_count
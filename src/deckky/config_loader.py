@@ -69,13 +69,16 @@ class ConfigLoader:
         else:
             logger.debug(f"No secrets file found at: {secrets_path}")
 
-        # Normalize button IDs to strings (YAML may parse them as integers)
+        # Normalize button IDs to integers (YAML yields strings for quoted keys)
         if 'groups' in config:
             for group_name, group_config in config['groups'].items():
                 if 'pages' in group_config:
                     for page_id, page_config in group_config['pages'].items():
                         if 'buttons' in page_config:
-                            page_config['buttons'] = {str(k): v for k, v in page_config['buttons'].items()}
+                            try:
+                                page_config['buttons'] = {int(k): v for k, v in page_config['buttons'].items()}
+                            except (TypeError, ValueError):
+                                raise ValueError(f"Group '{group_name}', Page {page_id} has a non-numeric button ID")
 
         ConfigLoader._validate(config)
         return config
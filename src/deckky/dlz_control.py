@@ -218,7 +218,7 @@ class DLZControl:
                     page_buttons = page_config.get('buttons', {})
                     
                     # Check if this button is a DLZ pad button
-                    button_config = page_buttons.get(str(button_num))
+                    button_config = page_buttons.get(button_num)
                     if button_config and button_config.get('type') == 'dlz_pad':
                         # Update this button
                         logger.debug(f"Updating DLZ button {button_num} in group '{group_name}'")
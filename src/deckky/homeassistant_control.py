@@ -1,11 +1,13 @@
 """Home Assistant WebSocket control for lights and other entities"""
 
 import asyncio
+import itertools
 import json
 import logging
+import random
 import threading
 import time
-from typing import Dict, Any, Optional, Callable, Set
+from typing import Dict, Any, Optional, Callable, List, Set, Tuple
 from deckky.button_utils import update_buttons_for_type
 
 logger = logging.getLogger(__name__)
@@ -18,33 +20,99 @@ except ImportError:
     HA_AVAILABLE = False
     logger.warning("websockets and aiohttp not installed. Home Assistant controls will be disabled.")
 
+# Prefer orjson for the WebSocket event stream, falling back to the stdlib codec
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        # Home Assistant only accepts text frames, so hand websockets a str
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Prefix found near the start of a WebSocket result frame
+_RESULT_FRAME_MARKER = '"type":"result"'
+
+# Label color for light buttons, keyed by whether the light is on
+_HA_LIGHT_COLOR = {True: '#9ece6a', False: '#7aa2f7'}
+
 
 class HomeAssistantControl:
     """Controls Home Assistant via WebSocket API with real-time status monitoring"""
 
+    # Seconds to wait for repeated calls to the same service/entity to settle
+    DEBOUNCE_DELAY = 0.3
+
+    # Maximum number of received messages waiting to be handled
+    EVENT_QUEUE_SIZE = 256
+
+    # Yield to other tasks after handling this many messages in a row
+    EVENT_YIELD_INTERVAL = 32
+
+    # Upper bound in seconds for the exponential reconnect backoff
+    MAX_RECONNECT_DELAY = 60
+
     def __init__(self, host: str = "localhost", port: int = 8123, access_token: str = "", ssl: bool = True):
+        """Initialize Home Assistant control
+
+        Args:
+            host: Home Assistant host
+            port: Home Assistant port
+            access_token: Long-lived access token
+            ssl: Use wss/https instead of ws/http
+        """
         self.host = host
         self.port = port
         self.access_token = access_token
         self.ssl = ssl
         self.ws = None
+
+        # REST session, created lazily on the client loop with the auth header attached
         self.session = None
+        self._auth_headers = {"Authorization": f"Bearer {access_token}"}
         self.connected = False
 
         self.entity_states = {}
         self.light_entities = set()
 
+        # Buttons showing each entity: {entity_id: [(group_name, page_num, button_num, button_config)]}
+        self._entity_buttons: Dict[str, List[Tuple[str, Any, int, dict]]] = {}
+
+        # WebSocket message ids, requests awaiting a result and the active state trigger subscription
+        self._msg_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._subscription_id: Optional[int] = None
+        self._subscribed_entities: Set[str] = set()
+        self._resubscribe_task: Optional[asyncio.Task] = None
+
+        # Entities changed since the last callback flush, which runs once per loop turn
+        self._dirty_entities: Set[str] = set()
+        self._notify_scheduled = False
+
         self.status_callbacks = []
 
         self.ws_thread = None
         self.ws_loop = None
         self.monitoring = False
         self.reconnect_interval = 5
+        # Consecutive failed connection attempts, reset after successful auth
+        self._fail_count = 0
+        # Set from disconnect() to cut the reconnect backoff short, created on the client loop
+        self._stop_event: Optional[asyncio.Event] = None
+
+        # Debounced service calls: {(domain, service, entity_id): TimerHandle}
+        self._pending_calls: Dict[Tuple[str, str, str], asyncio.TimerHandle] = {}
 
         if not HA_AVAILABLE:
             logger.error("Home Assistant libraries not available. Install with: pip install websockets aiohttp")
             return
 
+        if not access_token:
+            logger.error("Home Assistant access token not configured")
+            return
+
         self._start_websocket_client()
 
     def _get_websocket_url(self) -> str:
@@ -60,47 +128,72 @@ class HomeAssistantControl:
     def _start_websocket_client(self):
         """Start WebSocket client in background thread"""
         self.monitoring = True
+
         self.ws_thread = threading.Thread(target=self._websocket_client_thread, daemon=True)
         self.ws_thread.start()
         logger.debug("Started Home Assistant WebSocket client thread")
 
     def _websocket_client_thread(self):
         """WebSocket client running in background thread"""
-        self.ws_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.ws_loop)
+        # disconnect() clears self.ws_loop, so keep our own reference for closing it
+        loop = asyncio.new_event_loop()
+        self.ws_loop = loop
+        asyncio.set_event_loop(loop)
 
         try:
-            self.ws_loop.run_until_complete(self._websocket_client())
+            loop.run_until_complete(self._websocket_client())
         except Exception as e:
             logger.error(f"WebSocket client error: {e}")
         finally:
-            self.ws_loop.close()
+            loop.close()
 
     async def _websocket_client(self):
         """Main WebSocket client loop"""
-        while self.monitoring:
-            try:
-                await self._connect_websocket()
-                await self._listen_websocket()
-            except Exception as e:
-                logger.error(f"WebSocket connection error: {e}")
-                self.connected = False
-                
-            if self.monitoring:
-                logger.info(f"Reconnecting to Home Assistant in {self.reconnect_interval} seconds...")
-                await asyncio.sleep(self.reconnect_interval)
+        self._stop_event = asyncio.Event()
+        try:
+            while self.monitoring:
+                try:
+                    if await self._connect_websocket():
+                        await self._listen_websocket()
+                except Exception as e:
+                    logger.error(f"WebSocket connection error: {e}")
+                    self.connected = False
+
+                if self.monitoring:
+                    # Exponential backoff with jitter so clients don't reconnect in lockstep after an HA restart
+                    delay = min(self.MAX_RECONNECT_DELAY, self.reconnect_interval * (2 ** self._fail_count))
+                    delay *= 0.5 + random.random()
+                    self._fail_count += 1
+                    logger.info(f"Reconnecting to Home Assistant in {delay:.1f} seconds...")
+                    try:
+                        await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if self.session is not None:
+                await self.session.close()
+                self.session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared REST session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(headers=self._auth_headers)
+        return self.session
 
     async def _connect_websocket(self):
         """Connect to Home Assistant WebSocket"""
-        if not self.access_token:
-            logger.error("Home Assistant access token not configured")
-            return False
-
         try:
-            self.ws = await websockets.connect(self._get_websocket_url())
+            # Detect a dead Home Assistant within ~15s and cap buffered frame size
+            self.ws = await websockets.connect(
+                self._get_websocket_url(),
+                ping_interval=10,
+                ping_timeout=5,
+                close_timeout=2,
+                max_size=2**20
+            )
             
             auth_msg = await self.ws.recv()
-            auth_data = json.loads(auth_msg)
+            auth_data = _json_loads(auth_msg)
             
             if auth_data.get('type') != 'auth_required':
                 logger.error("Unexpected auth message from Home Assistant")
@@ -110,20 +203,25 @@ class HomeAssistantControl:
                 "type": "auth",
                 "access_token": self.access_token
             }
-            await self.ws.send(json.dumps(auth_response))
+            await self.ws.send(_json_dumps(auth_response))
             
             auth_result = await self.ws.recv()
-            auth_result_data = json.loads(auth_result)
+            auth_result_data = _json_loads(auth_result)
             
             if auth_result_data.get('type') != 'auth_ok':
                 logger.error(f"Home Assistant authentication failed: {auth_result_data}")
                 return False
 
             self.connected = True
+            self._fail_count = 0
             logger.info(f"Connected to Home Assistant WebSocket at {self.host}:{self.port}")
 
-            await self._subscribe_to_events()
-            await self._get_initial_states()
+            # Subscriptions do not survive a reconnect
+            self._subscription_id = None
+            self._subscribed_entities = set()
+
+            # Subscribing waits for its result, so it has to run alongside the listener
+            self._resubscribe_task = asyncio.create_task(self._on_connected())
 
             return True
 
@@ -131,44 +229,112 @@ class HomeAssistantControl:
             logger.error(f"Failed to connect to Home Assistant WebSocket: {e}")
             return False
 
-    async def _subscribe_to_events(self):
-        """Subscribe to state change events"""
+    async def _on_connected(self):
+        """Subscribe to tracked entities and fetch their initial states after connecting"""
+        await self._subscribe_to_events()
+        await self._get_initial_states()
+        # Pick up entities that were tracked while the initial states were loading
+        await self._resubscribe()
+
+    def _next_id(self) -> int:
+        """Get the next WebSocket message id"""
+        return next(self._msg_ids)
+
+    async def _ws_request(self, payload: Dict[str, Any], msg_id: Optional[int] = None,
+                          timeout: float = 10) -> Dict[str, Any]:
+        """Send a WebSocket command and wait for its result message
+
+        Args:
+            payload: Command without an id
+            msg_id: Id to send the command with, a new one is assigned when None
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Result message from Home Assistant
+        """
+        if msg_id is None:
+            msg_id = self._next_id()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = future
+        try:
+            await self.ws.send(_json_dumps({"id": msg_id, **payload}))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(msg_id, None)
+
+    async def _subscribe_to_events(self) -> bool:
+        """Subscribe to state changes of tracked entities only, replacing any previous subscription"""
+        entities = set(self.light_entities)
+        if not entities:
+            logger.debug("No Home Assistant entities tracked yet, skipping subscription")
+            return True
+
         try:
+            if self._subscription_id is not None:
+                unsubscribe_msg = {
+                    "type": "unsubscribe_events",
+                    "subscription": self._subscription_id
+                }
+                self._subscription_id = None
+                await self._ws_request(unsubscribe_msg)
+
             subscribe_msg = {
-                "id": 1,
-                "type": "subscribe_events",
-                "event_type": "state_changed"
+                "type": "subscribe_trigger",
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": sorted(entities)
+                }
             }
-            await self.ws.send(json.dumps(subscribe_msg))
-            logger.debug("Subscribed to Home Assistant state change events")
+            # Accept events for the new subscription as soon as they arrive
+            subscription_id = self._next_id()
+            self._subscription_id = subscription_id
+            result = await self._ws_request(subscribe_msg, subscription_id)
+            if not result.get('success'):
+                logger.error(f"Home Assistant rejected state subscription: {result.get('error')}")
+                self._subscription_id = None
+                return False
+
+            self._subscribed_entities = entities
+            logger.debug(f"Subscribed to Home Assistant state changes for {len(entities)} entities")
+            return True
         except Exception as e:
             logger.error(f"Failed to subscribe to Home Assistant events: {e}")
+            return False
 
-    async def _fetch_entity_state(self, entity_id: str, retry_delay: float = 0.1):
-        """Fetch current state for a specific entity"""
-        if not self.access_token:
+    def _schedule_resubscribe(self):
+        """Start a resubscribe task unless one is already pending (runs on ws_loop)"""
+        if self._resubscribe_task and not self._resubscribe_task.done():
             return
-
-        if retry_delay > 0:
-            await asyncio.sleep(retry_delay)
-
+        self._resubscribe_task = self.ws_loop.create_task(self._resubscribe())
+
+    async def _resubscribe(self):
+        """Resubscribe once a burst of newly tracked entities has settled"""
+        while self.connected and self._subscribed_entities != self.light_entities:
+            await asyncio.sleep(0.1)
+            new_entities = self.light_entities - self._subscribed_entities
+            if not await self._subscribe_to_events():
+                break
+            for entity_id in new_entities:
+                await self._fetch_entity_state(entity_id)
+
+    async def _fetch_entity_state(self, entity_id: str):
+        """Fetch current state for a specific entity"""
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
             url = f"{self._get_api_url()}/states/{entity_id}"
 
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        state_data = await response.json()
-                        old_state = self.entity_states.get(entity_id, {}).get('state')
-                        new_state = state_data.get('state')
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    state_data = await response.json()
+                    old_state = self.entity_states.get(entity_id, {}).get('state')
+                    new_state = state_data.get('state')
 
-                        self.entity_states[entity_id] = state_data
-                        logger.info(f"Fetched updated state for {entity_id}: {old_state} -> {new_state}")
+                    self.entity_states[entity_id] = state_data
+                    logger.info(f"Fetched updated state for {entity_id}: {old_state} -> {new_state}")
 
-                        self._notify_callbacks()
-                    else:
-                        logger.warning(f"Failed to fetch state for {entity_id}: {response.status}")
+                    self._notify_entity_changed(entity_id)
+                else:
+                    logger.warning(f"Failed to fetch state for {entity_id}: {response.status}")
         except Exception as e:
             logger.error(f"Error fetching state for {entity_id}: {e}")
 
@@ -178,21 +344,20 @@ class HomeAssistantControl:
             return
 
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
+            session = self._get_session()
 
-            async with aiohttp.ClientSession(headers=headers) as session:
-                for entity_id in self.light_entities:
-                    try:
-                        url = f"{self._get_api_url()}/states/{entity_id}"
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                state_data = await response.json()
-                                self.entity_states[entity_id] = state_data
-                                logger.debug(f"Got initial state for {entity_id}: {state_data.get('state')}")
-                            else:
-                                logger.warning(f"Failed to get state for {entity_id}: {response.status}")
-                    except Exception as e:
-                        logger.error(f"Error getting state for {entity_id}: {e}")
+            for entity_id in list(self.light_entities):
+                try:
+                    url = f"{self._get_api_url()}/states/{entity_id}"
+                    async with session.get(url) as response:
+                        if response.status == 200:
+                            state_data = await response.json()
+                            self.entity_states[entity_id] = state_data
+                            logger.debug(f"Got initial state for {entity_id}: {state_data.get('state')}")
+                        else:
+                            logger.warning(f"Failed to get state for {entity_id}: {response.status}")
+                except Exception as e:
+                    logger.error(f"Error getting state for {entity_id}: {e}")
 
             self._notify_callbacks()
 
@@ -200,75 +365,143 @@ class HomeAssistantControl:
             logger.error(f"Failed to get initial Home Assistant states: {e}")
 
     async def _listen_websocket(self):
-        """Listen for WebSocket messages"""
+        """Listen for WebSocket messages and queue them for the event consumer"""
+        event_queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+        consumer = asyncio.create_task(self._event_consumer(event_queue))
+
         try:
             async for message in self.ws:
+                # Home Assistant writes compact JSON with "id" then "type" first, so a
+                # result frame can be recognized without decoding it. Skip those when
+                # no request is waiting for one.
+                if not self._pending and _RESULT_FRAME_MARKER in message[:40]:
+                    continue
+
                 try:
-                    data = json.loads(message)
-                    await self._handle_websocket_message(data)
+                    data = _json_loads(message)
                 except json.JSONDecodeError as e:
                     logger.error(f"Invalid JSON from Home Assistant WebSocket: {e}")
-                except Exception as e:
-                    logger.error(f"Error handling WebSocket message: {e}")
+                    continue
+
+                # Waits while the queue is full, so a slow consumer stops reads from the socket
+                await event_queue.put(data)
         except websockets.exceptions.ConnectionClosed:
             logger.info("Home Assistant WebSocket connection closed")
         except Exception as e:
             logger.error(f"WebSocket listening error: {e}")
+        finally:
+            self.connected = False
+            consumer.cancel()
+            # Nothing will answer requests sent on this connection anymore
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Home Assistant WebSocket closed"))
+
+    async def _event_consumer(self, event_queue: asyncio.Queue):
+        """Handle queued WebSocket messages one at a time"""
+        handled = 0
+        while True:
+            data = await event_queue.get()
+            try:
+                await self._handle_websocket_message(data)
+            except Exception as e:
+                logger.error(f"Error handling WebSocket message: {e}")
+
+            handled += 1
+            if handled % self.EVENT_YIELD_INTERVAL == 0:
+                await asyncio.sleep(0)
 
     async def _handle_websocket_message(self, data: Dict[str, Any]):
         """Handle incoming WebSocket message"""
         message_type = data.get('type')
 
         if message_type == 'event':
-            event_data = data.get('event', {})
-            event_type = event_data.get('event_type')
-            
-            if event_type == 'state_changed':
-                await self._handle_state_change(event_data)
+            if data.get('id') != self._subscription_id:
+                return
 
-    async def _handle_state_change(self, event_data: Dict[str, Any]):
-        """Handle state change event"""
-        try:
-            event = event_data.get('data', {})
-            entity_id = event.get('entity_id')
-            
+            # Trigger events always carry variables.trigger; a malformed frame raises
+            # KeyError, which the event consumer logs. Filter untracked entities before
+            # doing any per-event work.
+            trigger = data['event']['variables']['trigger']
+            entity_id = trigger['entity_id']
             if entity_id not in self.light_entities:
                 return
 
-            new_state = event.get('new_state')
-            old_state = event.get('old_state')
+            await self._handle_state_change(entity_id, trigger)
+
+        elif message_type == 'result':
+            future = self._pending.get(data.get('id'))
+            if future and not future.done():
+                future.set_result(data)
+
+    async def _handle_state_change(self, entity_id: str, trigger: Dict[str, Any]):
+        """Handle state trigger event for a tracked entity"""
+        try:
+            # to_state is None when the entity was removed
+            new_state = trigger['to_state']
 
             if new_state:
                 self.entity_states[entity_id] = new_state
-                logger.debug(f"State changed for {entity_id}: {old_state.get('state') if old_state else 'None'} -> {new_state.get('state')}")
-                
-                self._notify_callbacks()
+                if logger.isEnabledFor(logging.DEBUG):
+                    old_state = trigger['from_state']
+                    logger.debug(f"State changed for {entity_id}: {old_state['state'] if old_state else 'None'} -> {new_state['state']}")
+
+                self._notify_entity_changed(entity_id)
 
         except Exception as e:
             logger.error(f"Error handling state change: {e}")
 
-    def _notify_callbacks(self):
-        """Notify all registered callbacks of status changes"""
+    def _notify_callbacks(self, entity_id: Optional[str] = None):
+        """Notify all registered callbacks of status changes
+
+        Args:
+            entity_id: Entity whose state changed, or None if any entity may have changed
+        """
         for callback in self.status_callbacks:
             try:
-                callback()
+                callback(entity_id)
             except Exception as e:
                 logger.error(f"Error in Home Assistant status callback: {e}")
 
-    def add_status_callback(self, callback: Callable[[], None]):
-        """Add a callback to be called when entity states change"""
+    def _notify_entity_changed(self, entity_id: str):
+        """Queue a callback notification for an entity, coalescing bursts of events"""
+        self._dirty_entities.add(entity_id)
+        if not self._notify_scheduled:
+            # Always called on the client loop; disconnect() may already have cleared self.ws_loop
+            asyncio.get_running_loop().call_soon(self._flush_notify)
+            self._notify_scheduled = True
+
+    def _flush_notify(self):
+        """Notify callbacks once for each entity changed since the last flush"""
+        self._notify_scheduled = False
+        dirty, self._dirty_entities = self._dirty_entities, set()
+        for entity_id in dirty:
+            self._notify_callbacks(entity_id)
+
+    def add_status_callback(self, callback: Callable[[Optional[str]], None]):
+        """Add a callback to be called with the changed entity_id (or None) when entity states change"""
         self.status_callbacks.append(callback)
 
-    def track_light_entity(self, entity_id: str):
-        """Start tracking a light entity for state updates"""
+    def track_light_entity(self, entity_id: str, button: Optional[Tuple[str, Any, int, dict]] = None):
+        """Start tracking a light entity for state updates
+
+        Args:
+            entity_id: Light entity to track
+            button: Optional (group_name, page_num, button_num, button_config) showing this entity,
+                used to redraw only the affected buttons when its state changes
+        """
+        if button is not None:
+            self._entity_buttons.setdefault(entity_id, []).append(button)
+
+        if entity_id in self.light_entities:
+            return
+
         self.light_entities.add(entity_id)
         logger.debug(f"Now tracking light entity: {entity_id}")
-        
+
+        # Extend the trigger subscription to the new entity and fetch its current state
         if self.connected and self.ws_loop:
-            asyncio.run_coroutine_threadsafe(
-                self._get_initial_states(), 
-                self.ws_loop
-            )
+            self.ws_loop.call_soon_threadsafe(self._schedule_resubscribe)
 
     def untrack_light_entity(self, entity_id: str):
         """Stop tracking a light entity"""
@@ -291,6 +524,21 @@ class HomeAssistantControl:
             logger.error("WebSocket event loop is not running")
             return False
 
+        if not self.connected:
+            logger.warning(f"Home Assistant not connected, dropping {domain}.{service} for {entity_id}")
+            return False
+
+        # Toggles are not idempotent, so coalescing them would change the resulting state
+        if service != 'toggle':
+            key = (domain, service, entity_id)
+            self.ws_loop.call_soon_threadsafe(self._schedule_service_call, key, kwargs)
+            return True
+
+        # Blocking on the future from the WebSocket loop itself would stall it until the timeout
+        if self._on_ws_loop():
+            self.ws_loop.create_task(self._call_service_async(domain, service, entity_id, **kwargs))
+            return True
+
         try:
             future = asyncio.run_coroutine_threadsafe(
                 self._call_service_async(domain, service, entity_id, **kwargs),
@@ -301,32 +549,46 @@ class HomeAssistantControl:
             logger.error(f"Failed to call Home Assistant service: {e}")
             return False
 
-    async def _call_service_async(self, domain: str, service: str, entity_id: str, **kwargs) -> bool:
-        """Call Home Assistant service via REST API"""
-        if not self.access_token:
-            logger.error("Home Assistant access token not configured")
+    def _on_ws_loop(self) -> bool:
+        """Check if the caller is running inside the WebSocket event loop"""
+        try:
+            return asyncio.get_running_loop() is self.ws_loop
+        except RuntimeError:
             return False
 
-        try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
+    def _schedule_service_call(self, key: Tuple[str, str, str], kwargs: Dict[str, Any]):
+        """Schedule a service call on the WebSocket loop, replacing any pending call for the same key"""
+        pending = self._pending_calls.pop(key, None)
+        if pending:
+            pending.cancel()
+
+        self._pending_calls[key] = self.ws_loop.call_later(
+            self.DEBOUNCE_DELAY, self._fire_service_call, key, kwargs
+        )
+
+    def _fire_service_call(self, key: Tuple[str, str, str], kwargs: Dict[str, Any]):
+        """Send the latest debounced service call for a key"""
+        self._pending_calls.pop(key, None)
+        domain, service, entity_id = key
+        self.ws_loop.create_task(self._call_service_async(domain, service, entity_id, **kwargs))
 
+    async def _call_service_async(self, domain: str, service: str, entity_id: str, **kwargs) -> bool:
+        """Call Home Assistant service via REST API"""
+        try:
             service_data = {"entity_id": entity_id}
             service_data.update(kwargs)
 
             url = f"{self._get_api_url()}/services/{domain}/{service}"
 
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.post(url, json=service_data) as response:
-                    if response.status == 200:
-                        logger.info(f"Called Home Assistant service {domain}.{service} for {entity_id}")
-
-                        await self._fetch_entity_state(entity_id)
-
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to call Home Assistant service {domain}.{service}: {response.status} - {error_text}")
-                        return False
+            async with self._get_session().post(url, json=service_data) as response:
+                if response.status == 200:
+                    # The new state arrives through the state trigger subscription
+                    logger.info(f"Called Home Assistant service {domain}.{service} for {entity_id}")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to call Home Assistant service {domain}.{service}: {response.status} - {error_text}")
+                    return False
 
         except Exception as e:
             logger.error(f"Error calling Home Assistant service {domain}.{service}: {e}")
@@ -344,56 +606,98 @@ class HomeAssistantControl:
         """Turn off a light"""
         return self._call_service_sync("light", "turn_off", entity_id, **kwargs)
 
+    async def toggle_light_async(self, entity_id: str) -> bool:
+        """Toggle a light (for callers already running on the WebSocket loop)"""
+        return await self._call_service_async("light", "toggle", entity_id)
+
+    async def turn_on_light_async(self, entity_id: str, **kwargs) -> bool:
+        """Turn on a light (for callers already running on the WebSocket loop)"""
+        return await self._call_service_async("light", "turn_on", entity_id, **kwargs)
+
+    async def turn_off_light_async(self, entity_id: str, **kwargs) -> bool:
+        """Turn off a light (for callers already running on the WebSocket loop)"""
+        return await self._call_service_async("light", "turn_off", entity_id, **kwargs)
+
     def get_light_state(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """Get current state of a light entity"""
         return self.entity_states.get(entity_id)
 
+    def get_state_fingerprint(self, entity_id: str) -> Optional[str]:
+        """Get the entity state Home Assistant buttons are drawn from, for detecting no-op refreshes"""
+        state_data = self.entity_states.get(entity_id)
+        return state_data.get('state') if state_data else None
+
     def is_light_on(self, entity_id: str) -> bool:
         """Check if a light is currently on"""
         state_data = self.get_light_state(entity_id)
         if state_data:
             state = state_data.get('state')
-            logger.debug(f"is_light_on({entity_id}): state='{state}'")
+            logger.debug("is_light_on(%s): state=%r", entity_id, state)
             return state == 'on'
-        logger.warning(f"is_light_on({entity_id}): No state data available, assuming OFF")
+        logger.warning("is_light_on(%s): No state data available, assuming OFF", entity_id)
         return False
 
     def setup_homeassistant_button(self, button_config: dict, create_image_callback, bg_color: str = 'black') -> bytes:
         """Setup Home Assistant button with visual feedback. Returns button image bytes."""
-        action = button_config.get('action')
         entity_id = button_config.get('entity_id', '')
-
-        fg_color = '#7aa2f7'
-
         label = button_config.get('label', '')
 
         if entity_id.startswith('light.'):
             is_on = self.is_light_on(entity_id)
-            logger.debug(f"Button setup for {entity_id}: is_on={is_on}, label='{label}'")
-
-            if is_on:
-                fg_color = '#9ece6a'
-            else:
-                fg_color = '#7aa2f7'
+            logger.debug("Button setup for %s: is_on=%s, label=%r", entity_id, is_on, label)
+            fg_color = _HA_LIGHT_COLOR[is_on]
+        else:
+            fg_color = _HA_LIGHT_COLOR[False]
 
         font_size = button_config.get('font_size', 'dynamic')
         return create_image_callback(label, bg_color=bg_color, fg_color=fg_color, font_size=font_size)
 
     def update_homeassistant_buttons(self, groups: dict, group_pages: dict, button_to_group: dict,
-                                   deck, create_image_callback):
-        """Update all Home Assistant buttons with current state"""
-        updated = update_buttons_for_type(
-            groups, group_pages, button_to_group,
-            deck, create_image_callback, 'homeassistant',
-            self.setup_homeassistant_button
-        )
+                                   deck, create_image_callback, entity_id: Optional[str] = None):
+        """Update Home Assistant buttons with current state
+
+        Only the buttons registered for entity_id are redrawn when it is given and known,
+        otherwise all Home Assistant buttons are updated.
+        """
+        if entity_id is not None and entity_id in self._entity_buttons:
+            updated = self._update_entity_buttons(entity_id, groups, group_pages, deck, create_image_callback)
+        else:
+            updated = update_buttons_for_type(
+                groups, group_pages, button_to_group,
+                deck, create_image_callback, 'homeassistant',
+                self.setup_homeassistant_button
+            )
         if updated > 0:
             logger.info(f"Updated {updated} Home Assistant button(s)")
 
+    def _update_entity_buttons(self, entity_id: str, groups: dict, group_pages: dict,
+                               deck, create_image_callback) -> int:
+        """Redraw the visible buttons registered for an entity. Returns count of keys written."""
+        updated_count = 0
+
+        for group_name, page_num, button_num, button_config in self._entity_buttons[entity_id]:
+            if group_pages.get(group_name, 0) != page_num:
+                continue
+
+            group_bg_color = groups.get(group_name, {}).get('bg_color', 'black')
+            image = self.setup_homeassistant_button(button_config, create_image_callback, group_bg_color)
+            if image and deck.set_key_image(button_num, image) is not False:
+                updated_count += 1
+
+        return updated_count
+
     def disconnect(self):
         """Disconnect from Home Assistant WebSocket"""
         self.monitoring = False
 
+        # Wake the client if it is sleeping in the reconnect backoff
+        loop = self.ws_loop
+        if loop and self._stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
         if self.ws and self.connected:
             try:
                 if self.ws_loop and not self.ws_loop.is_closed():
@@ -1,28 +1,43 @@
 """Centralized logging configuration for Deckky"""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+# Third-party loggers that emit per-frame DEBUG/INFO records
+NOISY_LOGGERS = ('websockets', 'aiohttp')
+
+# Handler installed on the root logger, reused when logging is set up again
+_handler: Optional[logging.Handler] = None
 
 
 def setup_logging(config: Dict[str, Any] = None):
     """Setup logging configuration for the application
-    
+
     Args:
         config: Configuration dictionary that may contain logging settings
     """
+    global _handler
+
     # Get log level from config, default to INFO
     log_level = logging.INFO
     if config and 'logging' in config:
         level_str = config['logging'].get('level', 'INFO').upper()
         log_level = getattr(logging, level_str, logging.INFO)
-    
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
+
+    # Configure root logger with a single explicit handler so repeated calls apply the new level
+    root = logging.getLogger()
+    if _handler is None:
+        _handler = logging.StreamHandler()
+        _handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+        root.addHandler(_handler)
+    root.setLevel(log_level)
+
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
     # Get logger for this module and log the configuration
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized at level {logging.getLevelName(log_level)}")
@@ -1,10 +1,14 @@
 """OBS WebSocket control for scene switching and recording/streaming"""
 
+import errno
+import json
 import logging
+import select
 import socket
 import threading
 import time
-from typing import Dict, Any, Optional, Callable
+from functools import lru_cache, partial
+from typing import Dict, Any, Optional, Callable, List
 from deckky.button_utils import update_buttons_for_type
 
 logger = logging.getLogger(__name__)
@@ -12,16 +16,104 @@ logger = logging.getLogger(__name__)
 try:
     import obswebsocket
     from obswebsocket import obsws, events, requests
+    from websocket import WebSocketConnectionClosedException
     OBS_AVAILABLE = True
 except ImportError:
     OBS_AVAILABLE = False
     logger.warning("obs-websocket-py not installed. OBS controls will be disabled.")
 
+# Kinds of OBS state change that status callbacks can subscribe to
+STATUS_KINDS = ('scene', 'record', 'stream')
+
+# State kind that each button action displays
+_ACTION_KINDS = {
+    'scene_switch': 'scene',
+    'toggle_recording': 'record',
+    'start_recording': 'record',
+    'stop_recording': 'record',
+    'toggle_streaming': 'stream',
+    'start_streaming': 'stream',
+    'stop_streaming': 'stream',
+}
+
+_COLOR_IDLE = '#7aa2f7'
+_COLOR_ACTIVE_SCENE = '#9ece6a'
+_COLOR_LIVE = '#f7768e'
+
+
+@lru_cache(maxsize=256)
+def _normalize_scene(scene_name: str) -> str:
+    """Normalize a scene name for case- and whitespace-insensitive comparison"""
+    return scene_name.strip().lower()
+
+
+def _style_scene(obs: 'OBSControl', button_config: dict, label: Optional[str]):
+    scene_name = button_config.get('scene', '')
+    if scene_name and _normalize_scene(scene_name) == obs._current_scene_norm:
+        return _COLOR_ACTIVE_SCENE, label or ''
+    return _COLOR_IDLE, label or ''
+
+
+def _style_toggle_recording(obs: 'OBSControl', button_config: dict, label: Optional[str]):
+    if obs.is_recording:
+        return _COLOR_LIVE, "Stop\nRecord"
+    return _COLOR_IDLE, "Start\nRecord"
+
+
+def _style_recording(obs: 'OBSControl', button_config: dict, label: Optional[str]):
+    if obs.is_recording:
+        return _COLOR_LIVE, "Recording"
+    return _COLOR_IDLE, 'Record' if label is None else label
+
+
+def _style_toggle_streaming(obs: 'OBSControl', button_config: dict, label: Optional[str]):
+    if obs.is_streaming:
+        return _COLOR_LIVE, "Stop\nStream"
+    return _COLOR_IDLE, "Start\nStream"
+
+
+def _style_streaming(obs: 'OBSControl', button_config: dict, label: Optional[str]):
+    if obs.is_streaming:
+        return _COLOR_LIVE, "Streaming"
+    return _COLOR_IDLE, 'Stream' if label is None else label
+
+
+# (fg_color, label) for each button action: {action: style(obs, button_config, configured_label)}
+_ACTION_STYLES = {
+    'scene_switch': _style_scene,
+    'toggle_recording': _style_toggle_recording,
+    'start_recording': _style_recording,
+    'stop_recording': _style_recording,
+    'toggle_streaming': _style_toggle_streaming,
+    'start_streaming': _style_streaming,
+    'stop_streaming': _style_streaming,
+}
+
 
 class OBSControl:
     """Controls OBS via WebSocket connection with event-based status monitoring"""
 
-    def __init__(self, host: str = "localhost", port: int = 4455, password: str = "", poll_interval: int = 1):
+    # Reconnect backoff bounds in seconds
+    RECONNECT_DELAY = 1
+    MAX_RECONNECT_DELAY = 30
+
+    # Seconds to wait for the port probe's TCP connect to complete
+    PROBE_TIMEOUT = 0.2
+
+    # Seconds to collect state change events before notifying callbacks once
+    NOTIFY_COALESCE_DELAY = 0.03
+
+    def __init__(self, host: str = "localhost", port: int = 4455, password: str = "", poll_interval: int = 1,
+                 autostart: bool = True):
+        """Initialize OBS control
+
+        Args:
+            host: OBS WebSocket host
+            port: OBS WebSocket port
+            password: OBS WebSocket password
+            poll_interval: Unused, kept for config compatibility
+            autostart: Connect and start the background threads now; otherwise call start()
+        """
         self.host = host
         self.port = port
         self.password = password
@@ -29,15 +121,39 @@ class OBSControl:
         self.ws = None
         self.connected = False
 
-        self.current_scene = None
+        self._current_scene = None
+        self._current_scene_norm = None
         self.is_recording = False
         self.is_streaming = False
 
-        self.status_callbacks = []
+        # Status callbacks by the kind of change they are interested in
+        self.status_callbacks: Dict[str, List[Callable[[Optional[str]], None]]] = {kind: [] for kind in STATUS_KINDS}
 
         self.reconnection_thread = None
         self.monitoring = False
 
+        # Kinds changed since the last notification, drained by the notify worker
+        self.notify_thread = None
+        self._dirty_kinds = set()
+        self._dirty_lock = threading.Lock()
+        self._dirty = threading.Event()
+
+        # Set while disconnected; the reconnection thread sleeps on it while connected
+        self._disconnected = threading.Event()
+        self._disconnected.set()
+        # Set by disconnect() to cut short the reconnection backoff
+        self._shutdown = threading.Event()
+        # Serializes reconnects from the reconnection thread and failing calls
+        self._connect_lock = threading.Lock()
+
+        if autostart:
+            self.start()
+
+    def start(self):
+        """Connect to OBS if it is running and start the reconnection and notify threads"""
+        if self.monitoring:
+            return
+
         if not OBS_AVAILABLE:
             logger.error("OBS WebSocket library not available. Install with: pip install obs-websocket-py")
             return
@@ -50,14 +166,30 @@ class OBSControl:
 
         self._start_reconnection_monitor()
 
+    @property
+    def current_scene(self) -> Optional[str]:
+        """Name of the current program scene"""
+        return self._current_scene
+
+    @current_scene.setter
+    def current_scene(self, scene_name: Optional[str]):
+        self._current_scene = scene_name
+        # Normalized once here so button redraws only compare strings
+        self._current_scene_norm = _normalize_scene(scene_name) if scene_name else None
+
     def _is_obs_running(self) -> bool:
         """Check if OBS WebSocket server is listening on the configured port"""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.5)
-            result = sock.connect_ex((self.host, self.port))
-            sock.close()
-            return result == 0
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                # Start the connect without blocking and wait a bounded time for it to complete
+                sock.setblocking(False)
+                result = sock.connect_ex((self.host, self.port))
+                if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    _, writable, _ = select.select([], [sock], [], self.PROBE_TIMEOUT)
+                    if not writable:
+                        return False
+                    result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                return result == 0
         except Exception as e:
             logger.debug(f"OBS port check failed: {e}")
             return False
@@ -67,15 +199,32 @@ class OBSControl:
         if not OBS_AVAILABLE:
             return False
 
+        with self._connect_lock:
+            # Another thread may have reconnected while this one waited
+            if self.connected:
+                return True
+            return self._open_connection()
+
+    def _open_connection(self) -> bool:
+        """Open a new obsws connection, replacing any previous one"""
+        if self.ws:
+            # Stop the receive thread of a connection that OBS is shutting down
+            try:
+                self.ws.disconnect()
+            except Exception:
+                pass
+
         try:
-            self.ws = obsws(self.host, self.port, self.password)
+            self.ws = obsws(self.host, self.port, self.password, on_disconnect=self._on_disconnect)
             self.ws.connect()
             self.connected = True
+            self._disconnected.clear()
             logger.info(f"Connected to OBS WebSocket at {self.host}:{self.port}")
             self._register_event_handlers()
             return True
         except Exception as e:
             self.connected = False
+            self._disconnected.set()
             logger.error(f"Failed to connect to OBS WebSocket at {self.host}:{self.port}: {e}")
             return False
 
@@ -85,9 +234,13 @@ class OBSControl:
             return
 
         try:
-            self.ws.register(self._on_scene_changed, events.CurrentProgramSceneChanged)
-            self.ws.register(self._on_record_state_changed, events.RecordStateChanged)
-            self.ws.register(self._on_stream_state_changed, events.StreamStateChanged)
+            self.ws.register(partial(self._on_state_event, 'current_scene', 'getSceneName', 'scene'),
+                             events.CurrentProgramSceneChanged)
+            self.ws.register(partial(self._on_state_event, 'is_recording', 'getOutputActive', 'record'),
+                             events.RecordStateChanged)
+            self.ws.register(partial(self._on_state_event, 'is_streaming', 'getOutputActive', 'stream'),
+                             events.StreamStateChanged)
+            self.ws.register(self._on_exit_started, events.ExitStarted)
             logger.debug("Registered OBS event handlers")
         except Exception as e:
             logger.error(f"Failed to register OBS event handlers: {e}")
@@ -99,64 +252,105 @@ class OBSControl:
             return
             
         try:
-            current_scene = self.get_current_scene()
-            recording_status = self.get_recording_status()
-            streaming_status = self.get_streaming_status()
+            # obs-websocket-py has no request batching, so send the three requests back to back
+            # on the checked connection and apply the results together afterwards
+            scene = self._call(requests.GetCurrentProgramScene())
+            record = self._call(requests.GetRecordStatus())
+            stream = self._call(requests.GetStreamStatus())
+
+            if scene.status:
+                self.current_scene = scene.datain['currentProgramSceneName']
+            if record.status:
+                self.is_recording = record.datain['outputActive']
+            if stream.status:
+                self.is_streaming = stream.datain['outputActive']
+
+            logger.debug(f"Initial OBS state: scene={self.current_scene}, recording={self.is_recording}, "
+                         f"streaming={self.is_streaming}")
 
-            if current_scene:
-                self.current_scene = current_scene
-                logger.debug(f"Initial OBS scene: {current_scene}")
-            
-            if recording_status:
-                self.is_recording = recording_status.get('isRecording', False)
-                logger.debug(f"Initial OBS recording state: {self.is_recording}")
-            
-            if streaming_status:
-                self.is_streaming = streaming_status.get('isActive', False)
-                logger.debug(f"Initial OBS streaming state: {self.is_streaming}")
-                
         except Exception as e:
             logger.error(f"Failed to get initial OBS state: {e}")
             logger.warning("OBS connection issues detected, continuing with limited functionality")
 
-    def _on_scene_changed(self, event):
-        """Event handler for scene changes"""
-        try:
-            scene_name = event.getSceneName()
-            if scene_name != self.current_scene:
-                logger.debug(f"Scene changed: {self.current_scene} -> {scene_name}")
-                self.current_scene = scene_name
-                self._notify_callbacks()
-        except Exception as e:
-            logger.error(f"Error handling scene change event: {e}")
+    def _on_state_event(self, attr: str, getter_name: str, kind: str, event):
+        """Event handler for scene, recording and streaming state changes
 
-    def _on_record_state_changed(self, event):
-        """Event handler for recording state changes"""
+        Args:
+            attr: OBSControl attribute holding the state
+            getter_name: Event getter returning the new state
+            kind: Status kind to notify when the state changed
+        """
         try:
-            is_active = event.getOutputActive()
-            if is_active != self.is_recording:
-                logger.debug(f"Recording state changed: {self.is_recording} -> {is_active}")
-                self.is_recording = is_active
-                self._notify_callbacks()
+            new_value = getattr(event, getter_name)()
+            old_value = getattr(self, attr)
+            if new_value != old_value:
+                logger.debug(f"OBS {kind} state changed: {old_value} -> {new_value}")
+                setattr(self, attr, new_value)
+                self._notify(kind)
         except Exception as e:
-            logger.error(f"Error handling recording state change event: {e}")
+            logger.error(f"Error handling OBS {kind} state change event: {e}")
 
-    def _on_stream_state_changed(self, event):
-        """Event handler for streaming state changes"""
-        try:
-            is_active = event.getOutputActive()
-            if is_active != self.is_streaming:
-                logger.debug(f"Streaming state changed: {self.is_streaming} -> {is_active}")
-                self.is_streaming = is_active
-                self._notify_callbacks()
-        except Exception as e:
-            logger.error(f"Error handling streaming state change event: {e}")
+    def _on_disconnect(self, ws):
+        """Connection loss handler called by obsws from its receive thread"""
+        # Ignore late notifications from a connection that has already been replaced
+        if ws is not self.ws:
+            return
+        logger.info("OBS WebSocket connection lost")
+        self._mark_disconnected()
+
+    def _on_exit_started(self, event):
+        """Event handler for OBS shutting down"""
+        logger.info("OBS is exiting")
+        self._mark_disconnected()
+
+    def _mark_disconnected(self):
+        """Flag the connection as down and wake the reconnection thread"""
+        self.connected = False
+        self._disconnected.set()
+
+    def _notify(self, kind: str):
+        """Queue a notification for a kind of status change, coalescing bursts of events"""
+        with self._dirty_lock:
+            self._dirty_kinds.add(kind)
+            self._dirty.set()
+
+    def _notify_worker(self):
+        """Deliver queued notifications once per kind after a short coalescing window"""
+        while self.monitoring:
+            self._dirty.wait()
+            if not self.monitoring:
+                break
+
+            # Let events fired together (e.g. on a scene collection switch) land in one pass
+            time.sleep(self.NOTIFY_COALESCE_DELAY)
+            with self._dirty_lock:
+                self._dirty.clear()
+                kinds, self._dirty_kinds = self._dirty_kinds, set()
+
+            for kind in kinds:
+                self._dispatch(kind)
+
+    def _dispatch(self, kind: str):
+        """Notify the callbacks registered for one kind of status change"""
+        # Iterate a snapshot so callbacks can be added from other threads meanwhile
+        for callback in tuple(self.status_callbacks[kind]):
+            # One failing callback must not keep the rest from seeing the change
+            try:
+                callback(kind)
+            except Exception as e:
+                logger.error(f"Error in status callback: {e}")
 
     def _notify_callbacks(self):
-        """Notify all registered callbacks of status changes"""
-        for callback in self.status_callbacks:
+        """Notify every registered callback once that any status may have changed"""
+        callbacks = []
+        for kind in STATUS_KINDS:
+            for callback in tuple(self.status_callbacks[kind]):
+                if callback not in callbacks:
+                    callbacks.append(callback)
+
+        for callback in callbacks:
             try:
-                callback()
+                callback(None)
             except Exception as e:
                 logger.error(f"Error in status callback: {e}")
 
@@ -170,41 +364,83 @@ class OBSControl:
         self.reconnection_thread.start()
         logger.debug("Started OBS reconnection monitor")
 
+        self.notify_thread = threading.Thread(target=self._notify_worker, daemon=True)
+        self.notify_thread.start()
+
     def _reconnection_monitor(self):
-        """Monitor connection and attempt reconnection if disconnected"""
-        reconnect_interval = 5
+        """Wait for a disconnect, then reconnect with exponential backoff"""
+        delay = self.RECONNECT_DELAY
 
         while self.monitoring:
-            if not self.connected:
-                if self._is_obs_running():
-                    logger.info("OBS WebSocket server detected, attempting to connect...")
-                    if self._connect():
-                        self._get_initial_state()
-                        self._notify_callbacks()
-                    else:
-                        time.sleep(reconnect_interval)
-                        continue
-                else:
-                    time.sleep(reconnect_interval)
+            # Blocks without waking up for as long as the connection is up
+            self._disconnected.wait()
+            if not self.monitoring:
+                break
+
+            if self._is_obs_running():
+                logger.info("OBS WebSocket server detected, attempting to connect...")
+                if self._connect():
+                    self._get_initial_state()
+                    self._notify_callbacks()
+                    delay = self.RECONNECT_DELAY
                     continue
 
-            time.sleep(reconnect_interval)
+            if self._shutdown.wait(delay):
+                break
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
 
-    def add_status_callback(self, callback: Callable[[], None]):
-        """Add a callback to be called when OBS status changes"""
-        self.status_callbacks.append(callback)
+    def add_status_callback(self, kind: str, callback: Callable[[Optional[str]], None]):
+        """Add a callback to be called with the kind of change (or None) when that OBS status changes"""
+        if kind not in self.status_callbacks:
+            raise ValueError(f"Unknown OBS status kind: {kind}")
+        if not callable(callback):
+            raise TypeError(f"OBS status callback is not callable: {callback!r}")
+        self.status_callbacks[kind].append(callback)
 
     def _ensure_connected(self) -> bool:
-        """Ensure WebSocket connection is active"""
-        if not self.connected or not self.ws:
-            return self._connect()
+        """Ensure WebSocket connection is active
+
+        The connected flag is kept current by disconnect events, so no request is sent to check it.
+        """
+        return (self.connected and self.ws is not None) or self._connect()
 
+    def _call(self, request):
+        """Send a request, reconnecting and retrying once if the connection turns out to be closed"""
         try:
-            self.ws.call(requests.GetVersion())
-            return True
-        except Exception:
-            self.connected = False
-            return self._connect()
+            return self.ws.call(request)
+        except (WebSocketConnectionClosedException, ConnectionError) as e:
+            logger.warning(f"OBS WebSocket connection closed ({e}), reconnecting")
+            self._mark_disconnected()
+            if not self._connect():
+                raise
+            return self.ws.call(request)
+
+    def _send(self, request):
+        """Send a request without waiting for its response
+
+        Falls back to a regular call for the legacy (v4) protocol.
+        """
+        if self.ws.legacy:
+            self._call(request)
+            return
+
+        message = json.dumps({
+            "op": 6,
+            "d": {
+                # No caller waits on this id, so the receive thread discards the response
+                "requestId": "deckky-no-reply",
+                "requestType": request.name,
+                "requestData": request.data()
+            }
+        })
+        try:
+            self.ws.ws.send(message)
+        except (WebSocketConnectionClosedException, ConnectionError) as e:
+            logger.warning(f"OBS WebSocket connection closed ({e}), reconnecting")
+            self._mark_disconnected()
+            if not self._connect():
+                raise
+            self.ws.ws.send(message)
 
     def switch_scene(self, scene_name: str) -> bool:
         """Switch to specified scene"""
@@ -212,7 +448,8 @@ class OBSControl:
             return False
 
         try:
-            self.ws.call(requests.SetCurrentProgramScene(sceneName=scene_name))
+            # The CurrentProgramSceneChanged event confirms the switch, so don't wait for the response
+            self._send(requests.SetCurrentProgramScene(sceneName=scene_name))
             logger.info(f"Switched to OBS scene: {scene_name}")
             return True
         except Exception as e:
@@ -239,7 +476,7 @@ class OBSControl:
             return False
 
         try:
-            self.ws.call(requests.StartRecord())
+            self._call(requests.StartRecord())
             logger.info("Started OBS recording")
             return True
         except Exception as e:
@@ -252,7 +489,7 @@ class OBSControl:
             return False
 
         try:
-            self.ws.call(requests.StopRecord())
+            self._call(requests.StopRecord())
             logger.info("Stopped OBS recording")
             return True
         except Exception as e:
@@ -265,7 +502,7 @@ class OBSControl:
             return False
 
         try:
-            self.ws.call(requests.StartStream())
+            self._call(requests.StartStream())
             logger.info("Started OBS streaming")
             return True
         except Exception as e:
@@ -278,20 +515,32 @@ class OBSControl:
             return False
 
         try:
-            self.ws.call(requests.StopStream())
+            self._call(requests.StopStream())
             logger.info("Stopped OBS streaming")
             return True
         except Exception as e:
             logger.error(f"Failed to stop OBS streaming: {e}")
             return False
 
+    def get_state_fingerprint(self, kind: str) -> Any:
+        """Get the state one kind of OBS button is drawn from, for detecting no-op refreshes
+
+        Args:
+            kind: Status kind ('scene', 'record', 'stream')
+        """
+        if kind == 'scene':
+            return self.current_scene
+        if kind == 'record':
+            return self.is_recording
+        return self.is_streaming
+
     def get_current_scene(self) -> Optional[str]:
         """Get current scene name"""
         if not self._ensure_connected():
             return None
 
         try:
-            result = self.ws.call(requests.GetCurrentProgramScene())
+            result = self._call(requests.GetCurrentProgramScene())
             return result.getCurrentProgramSceneName()
         except Exception as e:
             logger.error(f"Failed to get current OBS scene: {e}")
@@ -303,12 +552,12 @@ class OBSControl:
             return None
 
         try:
-            result = self.ws.call(requests.GetRecordStatus())
+            data = self._call(requests.GetRecordStatus()).datain
             return {
-                'isRecording': result.getOutputActive(),
-                'paused': result.getOutputPaused(),
-                'timecode': result.getOutputTimecode(),
-                'duration': result.getOutputDuration()
+                'isRecording': data['outputActive'],
+                'paused': data['outputPaused'],
+                'timecode': data['outputTimecode'],
+                'duration': data['outputDuration']
             }
         except Exception as e:
             logger.error(f"Failed to get OBS recording status: {e}")
@@ -320,70 +569,50 @@ class OBSControl:
             return None
 
         try:
-            result = self.ws.call(requests.GetStreamStatus())
+            data = self._call(requests.GetStreamStatus()).datain
             return {
-                'isActive': result.getOutputActive(),
-                'timecode': result.getOutputTimecode(),
-                'duration': result.getOutputDuration()
+                'isActive': data['outputActive'],
+                'timecode': data['outputTimecode'],
+                'duration': data['outputDuration']
             }
         except Exception as e:
             logger.error(f"Failed to get OBS streaming status: {e}")
             return None
 
-    def setup_obs_button(self, button_config: dict, create_image_callback, bg_color: str = 'black') -> bytes:
-        """Setup OBS button with visual feedback. Returns button image bytes."""
+    def setup_obs_button(self, button_config: dict, create_image_callback, bg_color: str = 'black',
+                         changed_kind: Optional[str] = None) -> Optional[bytes]:
+        """Setup OBS button with visual feedback. Returns button image bytes.
+
+        Returns None without rendering when changed_kind is given and the button's action
+        does not display that kind of state, so the caller leaves the key untouched.
+        """
         action = button_config.get('action')
-        scene_name = button_config.get('scene', '')
-
-        fg_color = '#7aa2f7'
-        label = button_config.get('label', '')
-        
-        if action == 'scene_switch' and scene_name:
-            current_scene_normalized = self.current_scene.strip().lower() if self.current_scene else None
-            button_scene_normalized = scene_name.strip().lower()
-
-            logger.debug(f"Scene button check: button_scene='{scene_name}', current_scene='{self.current_scene}', match={current_scene_normalized == button_scene_normalized}")
-
-            if current_scene_normalized == button_scene_normalized:
-                fg_color = '#9ece6a'
-                logger.debug(f"Scene '{scene_name}' is active, highlighting button")
-        
-        elif action in ['toggle_recording', 'start_recording', 'stop_recording']:
-            if self.is_recording:
-                fg_color = '#f7768e'
-                if action == 'toggle_recording':
-                    label = "Stop\nRecord"
-                else:
-                    label = "Recording"
-            else:
-                if action == 'toggle_recording':
-                    label = "Start\nRecord"
-                else:
-                    label = button_config.get('label', 'Record')
-        
-        elif action in ['toggle_streaming', 'start_streaming', 'stop_streaming']:
-            if self.is_streaming:
-                fg_color = '#f7768e'
-                if action == 'toggle_streaming':
-                    label = "Stop\nStream"
-                else:
-                    label = "Streaming"
-            else:
-                if action == 'toggle_streaming':
-                    label = "Start\nStream"
-                else:
-                    label = button_config.get('label', 'Stream')
-        
+        if changed_kind is not None and _ACTION_KINDS.get(action) != changed_kind:
+            return None
+
+        # Looked up once here; None means the button has no configured label
+        label = button_config.get('label')
         font_size = button_config.get('font_size', 'dynamic')
+
+        style = _ACTION_STYLES.get(action)
+        if style:
+            fg_color, label = style(self, button_config, label)
+        else:
+            fg_color, label = _COLOR_IDLE, label or ''
+
         return create_image_callback(label, bg_color=bg_color, fg_color=fg_color, font_size=font_size)
 
     def update_obs_buttons(self, groups: dict, group_pages: dict, button_to_group: dict,
-                           deck, create_image_callback):
-        """Update all OBS buttons with current state"""
+                           deck, create_image_callback, kind: Optional[str] = None):
+        """Update OBS buttons with current state
+
+        Only buttons showing the given kind of state are redrawn when kind is given,
+        otherwise all OBS buttons are updated.
+        """
         updated = update_buttons_for_type(
             groups, group_pages, button_to_group,
             deck, create_image_callback, 'obs',
-            self.setup_obs_button
+            partial(self.setup_obs_button, changed_kind=kind)
         )
         if updated > 0:
             logger.info(f"Updated {updated} OBS button(s)")
@@ -391,8 +620,13 @@ class OBSControl:
     def disconnect(self):
         """Disconnect from OBS WebSocket"""
         self.monitoring = False
+        self._shutdown.set()
+        self._disconnected.set()
+        self._dirty.set()
         if self.reconnection_thread:
             self.reconnection_thread.join(timeout=2)
+        if self.notify_thread:
+            self.notify_thread.join(timeout=2)
             
         if self.ws and self.connected:
             try:
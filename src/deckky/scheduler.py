@@ -0,0 +1,87 @@
+"""Single-thread deadline scheduler for delayed callbacks"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """Runs delayed callbacks from one persistent thread, keyed so they can be cancelled"""
+
+    def __init__(self, name: str = 'deckky-scheduler'):
+        self.name = name
+        self._heap = []  # (deadline, seq, key, callback)
+        self._pending = {}  # Live entry for each key: {key: seq}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Start the scheduler thread"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the scheduler thread, dropping callbacks that haven't run yet"""
+        with self._cond:
+            self._running = False
+            self._heap.clear()
+            self._pending.clear()
+            self._cond.notify()
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable[[], None]):
+        """Run callback after delay seconds, replacing any pending callback for key"""
+        with self._cond:
+            seq = next(self._seq)
+            self._pending[key] = seq
+            heapq.heappush(self._heap, (time.monotonic() + delay, seq, key, callback))
+            self._cond.notify()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the pending callback for key
+
+        Returns:
+            True if a callback was pending, False if it already ran or none was scheduled
+        """
+        with self._cond:
+            return self._pending.pop(key, None) is not None
+
+    def _run(self):
+        """Wait for the nearest deadline and run its callback outside the lock"""
+        while True:
+            with self._cond:
+                callback = None
+                while self._running:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    deadline, seq, key, entry_callback = self._heap[0]
+                    # Cancelled and replaced entries stay in the heap until they reach the top
+                    if self._pending.get(key) != seq:
+                        heapq.heappop(self._heap)
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    heapq.heappop(self._heap)
+                    del self._pending[key]
+                    callback = entry_callback
+                    break
+                if callback is None:
+                    return
+
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled callback for {key}: {e}")
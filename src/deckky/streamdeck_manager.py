@@ -1,19 +1,30 @@
 """Stream Deck device manager"""
 
 import logging
+import os
+import selectors
 import threading
 import time
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 from StreamDeck.DeviceManager import DeviceManager
 from StreamDeck.ImageHelpers import PILHelper
 from PIL import Image, ImageDraw, ImageFont
 from deckky.action_handler import ActionHandler
+from deckky.button_utils import KeyImageWriter
 from deckky.config_loader import ConfigLoader
+from deckky.obs_control import STATUS_KINDS
+from deckky.scheduler import Scheduler
 from deckky.volume_control import VolumeControl
 
 logger = logging.getLogger(__name__)
 
+# Button types whose image reflects live state and can't be rendered ahead of time
+LIVE_BUTTON_TYPES = ('obs', 'homeassistant', 'volume', 'dlz_pad')
+
 # Try to import inotify for efficient file watching
 try:
     from inotify_simple import INotify, flags
@@ -26,30 +37,60 @@ except ImportError:
 class StreamDeckManager:
     """Manages Stream Deck device connection and events"""
 
+    # Maximum number of rendered button images kept in the LRU image cache
+    IMAGE_CACHE_SIZE = 256
+
+    # Seconds without further config file events before a reload runs
+    CONFIG_RELOAD_DEBOUNCE = 0.3
+
     def __init__(self, config: Dict[str, Any], config_path: Path = Path("config.yaml")):
         self.config = config
         self.config_path = config_path
         self.deck = None
-        self.action_handler = ActionHandler(config)
+        self.keys = None  # KeyImageWriter for self.deck, skips rewriting unchanged key images
+        self._key_size = None  # Key image size (width, height), read once after the deck is opened
+        self._key_count = 0
+        self._blank_image = None  # Native-format black key image
         self.volume_control = VolumeControl()
+        self._scheduler = Scheduler()  # Hold-to-home and volume ramp timers, shared with the action handler
+        self.action_handler = ActionHandler(config, self.volume_control, self._scheduler)
         self.button_states = {}
         self.config_last_modified = config_path.stat().st_mtime if config_path.exists() else 0
         self.config_lock = threading.Lock()
         self.running = True
+        self._stop_event = threading.Event()  # Set when the manager should shut down
         self.group_pages = {}  # Track current page for each group: {group_name: page_num}
         self.button_to_group = {}  # Map button numbers to their group: {button_num: group_name}
+        self._btn_group = []  # Group name of each key, indexed by key number (None if unassigned)
         self.groups = {}  # Store group configurations
+        self._last_obs_fp = {}  # OBS state each kind of OBS button was last drawn from: {kind: state}
+        self._last_ha_fp = {}  # Entity state the Home Assistant buttons were last drawn from: {entity_id: state}
+        self._page_buttons = {}  # Button config of each key per page: {(group_name, page_num): [button_config or None]}
 
         # Performance caches
         self.font_cache = {}  # Cache loaded fonts: {(font_path, size): font_object}
+        self.font_cache_lock = threading.Lock()  # Fonts are loaded from the render pool too
         self.available_font_path = None  # First available font path (cached)
-        self.image_cache = {}  # Cache generated images: {(text, bg, fg, size): image_bytes}
+        self._base_fonts = {}  # Font loaded from in-memory file bytes, reused for other sizes: {font_path: font}
+        self.image_cache = OrderedDict()  # LRU of generated images: {(text, bg, fg, size): image_bytes}
+        self.image_cache_lock = threading.Lock()  # Buttons are rendered from several threads
+        self._measure_draw = ImageDraw.Draw(Image.new('L', (1, 1)))  # Text measurement only needs fonts, not pixels
 
         # Font configuration
         self.font_paths = self._get_font_paths()
 
-        # Page switch hold-to-home tracking
-        self.page_switch_timers = {}  # Track hold timers for page switch buttons: {button_id: timer}
+        # Renders group pages in parallel; key writes stay on the calling thread
+        self._render_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='deckky-render')
+
+        # Applies reloaded configs one at a time, off the config watcher thread
+        self._reload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='deckky-reload')
+        self._pending_config = None  # Newest parsed config waiting to be applied
+
+        # Write end of the pipe that wakes the inotify config watcher on shutdown
+        self._config_watch_wake = None
+        # Held while writing to or closing the wake fd, so stop() never writes to a closed or reused fd
+        self._config_watch_wake_lock = threading.Lock()
+
 
     def run(self):
         """Initialize and run the Stream Deck manager"""
@@ -60,6 +101,12 @@ class StreamDeckManager:
 
         self.deck = streamdecks[0]
         self.deck.open()
+        self.keys = KeyImageWriter(self.deck)
+
+        # Key geometry doesn't change while the deck is open
+        self._key_size = self.deck.key_image_format()['size']
+        self._key_count = self.deck.key_count()
+        self._blank_image = PILHelper.to_native_format(self.deck, Image.new('RGB', self._key_size, 'black'))
 
         # Give the USB device a moment to stabilize after opening
         time.sleep(0.1)
@@ -72,7 +119,7 @@ class StreamDeckManager:
             logger.warning(f"Failed to reset Stream Deck (continuing anyway): {e}")
 
         logger.info(f"Connected to {self.deck.deck_type()} "
-                   f"({self.deck.key_count()} keys)")
+                   f"({self._key_count} keys)")
 
         # Set brightness
         brightness = self.config.get('streamdeck', {}).get('brightness', 80)
@@ -83,7 +130,8 @@ class StreamDeckManager:
 
         # Set up OBS status callback for visual feedback BEFORE initializing buttons
         if hasattr(self.action_handler, 'obs_control') and self.action_handler.obs_control:
-            self.action_handler.obs_control.add_status_callback(self._on_obs_status_change)
+            for kind in STATUS_KINDS:
+                self.action_handler.obs_control.add_status_callback(kind, self._on_obs_status_change)
             # Small delay to ensure OBS initial state is fetched
             time.sleep(0.5)
 
@@ -116,6 +164,7 @@ class StreamDeckManager:
         self.volume_control.add_change_callback(self._on_volume_change)
 
         # Register button callback
+        self._scheduler.start()
         self.deck.set_key_callback(self._key_change_callback)
 
         # Start config file watcher thread
@@ -125,33 +174,35 @@ class StreamDeckManager:
         logger.info("Stream Deck ready. Press Ctrl+C to exit.")
         logger.info("Config file auto-reload enabled")
 
-        # Keep running
+        # Keep running until stop() is called
         try:
-            while self.running:
-                time.sleep(0.1)
+            self._stop_event.wait()
         finally:
             self._cleanup()
 
+    def stop(self):
+        """Ask the manager to shut down; run() returns after cleaning up"""
+        self.running = False
+        self._stop_event.set()
+        self._wake_config_watcher()
+
     def _track_all_ha_entities(self):
         """Pre-track all Home Assistant entities from config to ensure initial states are fetched"""
         if not hasattr(self.action_handler, 'ha_control') or not self.action_handler.ha_control:
             return
 
-        ha_control = self.action_handler.ha_control
+        track_light_entity = self.action_handler.ha_control.track_light_entity
         groups = self.config.get('groups', {})
 
         for group_name, group_config in groups.items():
-            pages = group_config.get('pages', {})
-            
-            for page_num, page_config in pages.items():
-                page_buttons = page_config.get('buttons', {})
-                
-                for button_id, button_config in page_buttons.items():
-                    if button_config.get('type') == 'homeassistant':
-                        entity_id = button_config.get('entity_id')
-                        if entity_id and entity_id.startswith('light.'):
-                            logger.debug(f"Pre-tracking Home Assistant entity: {entity_id}")
-                            ha_control.track_light_entity(entity_id)
+            for page_num, page_config in group_config.get('pages', {}).items():
+                for button_num, button_config in page_config.get('buttons', {}).items():
+                    if button_config.get('type') != 'homeassistant':
+                        continue
+                    entity_id = button_config.get('entity_id')
+                    if entity_id and entity_id.startswith('light.'):
+                        logger.debug("Pre-tracking Home Assistant entity: %s", entity_id)
+                        track_light_entity(entity_id, (group_name, page_num, button_num, button_config))
 
     def _get_font_paths(self) -> list:
         """Get font paths from config or use defaults
@@ -184,12 +235,10 @@ class StreamDeckManager:
         self.groups = self.config['groups']
         logger.info(f"Using spatial group system with {len(self.groups)} groups")
 
-        # Clear all buttons on the deck first (important for config reloads)
-        self._clear_all_buttons()
-
         # Build button-to-group mapping and initialize each group to page 0
         self.button_to_group = {}
         self.group_pages = {}
+        btn_group = [None] * self._key_count
 
         for group_name, group_config in self.groups.items():
             # Initialize each group to page 0
@@ -199,23 +248,91 @@ class StreamDeckManager:
             button_range = group_config.get('buttons', [])
             for button_num in button_range:
                 self.button_to_group[button_num] = group_name
+                if 0 <= button_num < self._key_count:
+                    btn_group[button_num] = group_name
 
             logger.info(f"Group '{group_name}' owns buttons {button_range}")
 
-        # Load all groups at their initial pages
-        self._load_all_groups()
+        self._btn_group = btn_group
+        self._rebuild_lookup()
+
+        # Load all groups at their initial pages, then blank the keys they didn't draw (important for config reloads)
+        covered = self._load_all_groups()
+        self._clear_uncovered_buttons(covered)
+
+        # Render the other pages' static buttons in the background so page switches hit the cache
+        self._render_pool.submit(self._warm_image_cache)
+
+    def _rebuild_lookup(self):
+        """Flatten groups/pages/buttons into per-page arrays indexed by key number"""
+        page_buttons = {}
+        for group_name, group_config in self.groups.items():
+            for page_num, page_config in group_config.get('pages', {}).items():
+                by_key = [None] * self._key_count
+                for button_num, button_config in page_config.get('buttons', {}).items():
+                    if 0 <= button_num < self._key_count:
+                        by_key[button_num] = button_config
+                page_buttons[(group_name, page_num)] = by_key
+        self._page_buttons = page_buttons
+
+    def _warm_image_cache(self):
+        """Render every button whose image depends only on the config into the image cache"""
+        warmed = 0
+        for group_config in list(self.groups.values()):
+            group_bg_color = group_config.get('bg_color', 'black')
+            for page_config in group_config.get('pages', {}).values():
+                for button_config in page_config.get('buttons', {}).values():
+                    if button_config.get('type', '') in LIVE_BUTTON_TYPES:
+                        continue
+
+                    label = button_config.get('label', '')
+                    if button_config.get('type', '') == 'page_switch':
+                        label = label if label else f"Page\n{button_config.get('page', 0)}"
+                    if not label:
+                        continue
+
+                    self._create_button_image(label, bg_color=group_bg_color,
+                                              font_size=button_config.get('font_size', 'dynamic'))
+                    warmed += 1
 
-    def _load_all_groups(self):
-        """Load all groups at their current pages"""
-        for group_name in self.groups.keys():
-            page_num = self.group_pages.get(group_name, 0)
-            self._load_group_page(group_name, page_num)
+        logger.debug(f"Warmed image cache with {warmed} static button(s)")
+
+    def _load_all_groups(self) -> set:
+        """Load all groups at their current pages
+
+        Returns:
+            Set of key numbers written to the deck
+        """
+        # Render all groups in the pool, then write them to the deck in order
+        renders = [
+            self._render_pool.submit(self._render_group_page, group_name, self.group_pages.get(group_name, 0))
+            for group_name in self.groups.keys()
+        ]
+        covered = set()
+        for render in renders:
+            updates = render.result()
+            self._flush_group_page(updates)
+            covered.update(button_num for button_num, _ in updates)
+        return covered
 
     def _load_group_page(self, group_name: str, page_num: int):
         """Load a specific page for a specific group (only updates that group's buttons)"""
+        self._flush_group_page(self._render_group_page(group_name, page_num))
+
+    def _flush_group_page(self, updates: list):
+        """Write rendered key images to the deck"""
+        for button_num, image in updates:
+            self._set_key(button_num, image)
+
+    def _render_group_page(self, group_name: str, page_num: int) -> list:
+        """Render a page of a group without touching the deck
+
+        Returns:
+            List of (button_num, image) pairs for the group's buttons
+        """
         if group_name not in self.groups:
             logger.error(f"Group '{group_name}' not found!")
-            return
+            return []
 
         group_config = self.groups[group_name]
         pages = group_config.get('pages', {})
@@ -226,7 +343,7 @@ class StreamDeckManager:
             page_num = 0
             if page_num not in pages:
                 logger.error(f"No pages configured in group '{group_name}'!")
-                return
+                return []
 
         # Update the current page for this group
         self.group_pages[group_name] = page_num
@@ -236,99 +353,120 @@ class StreamDeckManager:
 
         logger.info(f"Loading group '{group_name}', page {page_num}: {page_config.get('name', 'Unnamed')}")
 
+        updates = []
+        append = updates.append
+        create_image = self._create_button_image
+        blank_image = self._create_blank_image()
+        in_group = set(button_range)
+
+        # Get group background color if specified
+        group_bg_color = group_config.get('bg_color', 'black')
+
+        # Integrations are looked up once per page rather than per button
+        action_handler = self.action_handler
+        obs_control = getattr(action_handler, 'obs_control', None)
+        ha_control = getattr(action_handler, 'ha_control', None)
+        dlz_control = getattr(action_handler, 'dlz_control', None)
+        volume_control = self.volume_control
+
         # Clear buttons in this group's range that aren't configured
-        configured_in_page = set(int(btn_id) for btn_id in page_buttons.keys())
         for button_num in button_range:
-            if button_num not in configured_in_page:
-                self.deck.set_key_image(button_num, self._create_blank_image())
+            if button_num not in page_buttons:
+                append((button_num, blank_image))
 
         # Load buttons for this page
-        for button_id, button_config in page_buttons.items():
-            button_num = int(button_id)
-
+        for button_num, button_config in page_buttons.items():
             # Verify button belongs to this group
-            if button_num not in button_range:
+            if button_num not in in_group:
                 logger.warning(f"Button {button_num} in group '{group_name}' page {page_num} "
                              f"is outside group's button range {button_range}")
                 continue
 
-            label = button_config.get('label', '')
-            font_size = button_config.get('font_size', 'dynamic')
-            button_type = button_config.get('type', '')
-            action = button_config.get('action', '')
+            get = button_config.get
+            label = get('label', '')
+            font_size = get('font_size', 'dynamic')
+            button_type = get('type', '')
 
-            logger.debug(f"Button {button_num}: type={button_type}, label='{label}'")
-
-            # Get group background color if specified
-            group_bg_color = group_config.get('bg_color', 'black')
+            logger.debug("Button %s: type=%s, label=%r", button_num, button_type, label)
 
             # Handle page_switch buttons
             if button_type == 'page_switch':
-                target_page = button_config.get('page', 0)
-                target_group = button_config.get('group', group_name)  # Default to current group
-                page_label = label if label else f"Page\n{target_page}"
-                image = self._create_button_image(page_label, bg_color=group_bg_color, font_size=font_size)
-                self.deck.set_key_image(button_num, image)
+                page_label = label if label else f"Page\n{get('page', 0)}"
+                append((button_num, create_image(page_label, bg_color=group_bg_color, font_size=font_size)))
             # Handle OBS buttons with visual feedback
             elif button_type == 'obs':
-                if hasattr(self.action_handler, 'obs_control') and self.action_handler.obs_control:
-                    logger.debug(f"Setting up OBS button {button_num}: {button_config}")
-                    image = self.action_handler.obs_control.setup_obs_button(
-                        button_config, self._create_button_image, group_bg_color
-                    )
-                    self.deck.set_key_image(button_num, image)
+                if obs_control:
+                    logger.debug("Setting up OBS button %s: %s", button_num, button_config)
+                    append((button_num, obs_control.setup_obs_button(button_config, create_image, group_bg_color)))
             # Handle Home Assistant buttons with visual feedback
             elif button_type == 'homeassistant':
-                if hasattr(self.action_handler, 'ha_control') and self.action_handler.ha_control:
-                    logger.debug(f"Setting up Home Assistant button {button_num}: {button_config}")
-                    image = self.action_handler.ha_control.setup_homeassistant_button(
-                        button_config, self._create_button_image
-                    )
-                    self.deck.set_key_image(button_num, image)
+                if ha_control:
+                    logger.debug("Setting up Home Assistant button %s: %s", button_num, button_config)
+                    append((button_num, ha_control.setup_homeassistant_button(button_config, create_image)))
             # Handle volume buttons with visual feedback
             elif button_type == 'volume':
-                logger.debug(f"Setting up volume button {button_num}: {button_config}")
-                image = self.volume_control.setup_volume_button(
-                    button_config, self._create_button_image, group_bg_color
-                )
-                self.deck.set_key_image(button_num, image)
+                logger.debug("Setting up volume button %s: %s", button_num, button_config)
+                append((button_num, volume_control.setup_volume_button(button_config, create_image, group_bg_color)))
             # Handle DLZ Pad buttons with visual feedback
             elif button_type == 'dlz_pad':
-                if hasattr(self.action_handler, 'dlz_control') and self.action_handler.dlz_control:
-                    logger.debug(f"Setting up DLZ pad button {button_num}: {button_config}")
+                if dlz_control:
+                    logger.debug("Setting up DLZ pad button %s: %s", button_num, button_config)
                     # Calculate button index within group (for pad mapping)
                     button_index = button_range.index(button_num)
-                    image = self.action_handler.dlz_control.setup_dlz_button(
-                        button_config, self._create_button_image, button_index
-                    )
-                    self.deck.set_key_image(button_num, image)
+                    append((button_num, dlz_control.setup_dlz_button(button_config, create_image, button_index)))
             elif label:
-                image = self._create_button_image(label, bg_color=group_bg_color, font_size=font_size)
-                self.deck.set_key_image(button_num, image)
+                append((button_num, create_image(label, bg_color=group_bg_color, font_size=font_size)))
 
+        return updates
 
-    def _on_obs_status_change(self):
-        """Callback for OBS status changes - update button appearances"""
+    def _on_obs_status_change(self, kind: str = None):
+        """Callback for OBS status changes - update button appearances
+
+        Args:
+            kind: Kind of state that changed ('scene', 'record', 'stream'), or None to update all OBS buttons
+        """
         if not self.running:
             return
-            
-        # Use OBS control module to update all OBS buttons
+
+        # Use OBS control module to update the affected OBS buttons
         if hasattr(self.action_handler, 'obs_control') and self.action_handler.obs_control:
+            # Events that leave the drawn state unchanged need no redraw; kind=None always refreshes
+            obs_control = self.action_handler.obs_control
+            if kind is None:
+                self._last_obs_fp = {k: obs_control.get_state_fingerprint(k) for k in STATUS_KINDS}
+            else:
+                # Compared per kind: a coalesced pass dispatches several kinds back to back
+                fingerprint = obs_control.get_state_fingerprint(kind)
+                if kind in self._last_obs_fp and self._last_obs_fp[kind] == fingerprint:
+                    return
+                self._last_obs_fp[kind] = fingerprint
             self.action_handler.obs_control.update_obs_buttons(
-                self.groups, self.group_pages, self.button_to_group, 
-                self.deck, self._create_button_image
+                self.groups, self.group_pages, self.button_to_group,
+                self.keys, self._create_button_image, kind
             )
 
-    def _on_ha_status_change(self):
-        """Callback for Home Assistant status changes - update button appearances"""
+    def _on_ha_status_change(self, entity_id: str = None):
+        """Callback for Home Assistant status changes - update button appearances
+
+        Args:
+            entity_id: Entity that changed, or None to update all Home Assistant buttons
+        """
         if not self.running:
             return
             
-        # Use Home Assistant control module to update all HA buttons
+        # Use Home Assistant control module to update the affected HA buttons
         if hasattr(self.action_handler, 'ha_control') and self.action_handler.ha_control:
+            # Attribute-only changes (brightness, color) don't change the button; entity_id=None always refreshes
+            if entity_id is None:
+                self._last_ha_fp.clear()
+            else:
+                fingerprint = self.action_handler.ha_control.get_state_fingerprint(entity_id)
+                if entity_id in self._last_ha_fp and self._last_ha_fp[entity_id] == fingerprint:
+                    return
+                self._last_ha_fp[entity_id] = fingerprint
             self.action_handler.ha_control.update_homeassistant_buttons(
                 self.groups, self.group_pages, self.button_to_group, 
-                self.deck, self._create_button_image
+                self.keys, self._create_button_image, entity_id
             )
 
     def _on_dlz_status_change(self):
@@ -340,7 +478,7 @@ class StreamDeckManager:
         if hasattr(self.action_handler, 'dlz_control') and self.action_handler.dlz_control:
             self.action_handler.dlz_control.update_dlz_buttons(
                 self.groups, self.group_pages, self.button_to_group,
-                self.deck, self._create_button_image
+                self.keys, self._create_button_image
             )
 
     def switch_page(self, group_name: str, page_num: int):
@@ -349,17 +487,34 @@ class StreamDeckManager:
         self._load_group_page(group_name, page_num)
 
     def _create_blank_image(self) -> bytes:
-        """Create a blank black button image"""
-        image = Image.new('RGB', self.deck.key_image_format()['size'], 'black')
-        return PILHelper.to_native_format(self.deck, image)
+        """Get the blank black button image"""
+        return self._blank_image
 
-    def _clear_all_buttons(self):
-        """Clear all buttons on the Stream Deck"""
-        blank_image = self._create_blank_image()
-        key_count = self.deck.key_count()
-        for key in range(key_count):
-            self.deck.set_key_image(key, blank_image)
-        logger.debug(f"Cleared all {key_count} buttons")
+    def _set_key(self, button_num: int, image: bytes):
+        """Set a key image, skipping the USB write when the key already shows it"""
+        self.keys.set_key_image(button_num, image)
+
+    def _clear_uncovered_buttons(self, covered: set):
+        """Blank the keys not drawn by any group page
+
+        Keys drawn by a page were just written, so blanking them too would only double the
+        USB writes; keys already showing blank are skipped by _set_key.
+        """
+        uncovered = [key for key in range(self._key_count) if key not in covered]
+        for key in uncovered:
+            self._set_key(key, self._blank_image)
+        logger.debug(f"Cleared {len(uncovered)} uncovered button(s)")
+
+    def _open_font(self, font_path: str, size: int):
+        """Open a font at a size, reading the font file only once per path"""
+        base_font = self._base_fonts.get(font_path)
+        if base_font is None:
+            with open(font_path, 'rb') as font_file:
+                base_font = ImageFont.truetype(BytesIO(font_file.read()), size)
+            self._base_fonts[font_path] = base_font
+            return base_font
+        # Variants of a font loaded from bytes reuse those bytes instead of reopening the file
+        return base_font.font_variant(size=size)
 
     def _load_font_cached(self, font_paths: list, size: int):
         """Load a font with caching to avoid repeated file I/O
@@ -371,39 +526,56 @@ class StreamDeckManager:
         Returns:
             Font object or None if no font could be loaded
         """
-        # Try to use cached available font path first
-        if self.available_font_path:
-            cache_key = (self.available_font_path, size)
-            if cache_key in self.font_cache:
-                return self.font_cache[cache_key]
+        with self.font_cache_lock:
+            # Try to use cached available font path first
+            if self.available_font_path:
+                cache_key = (self.available_font_path, size)
+                if cache_key in self.font_cache:
+                    return self.font_cache[cache_key]
 
-            try:
-                font = ImageFont.truetype(self.available_font_path, size)
-                self.font_cache[cache_key] = font
-                return font
-            except (OSError, IOError):
-                # Cached font path no longer works, clear it
-                self.available_font_path = None
-
-        # Find and cache an available font path
-        for font_path in font_paths:
-            cache_key = (font_path, size)
-
-            # Check if already in cache
-            if cache_key in self.font_cache:
-                self.available_font_path = font_path
-                return self.font_cache[cache_key]
-
-            # Try to load this font
-            try:
-                font = ImageFont.truetype(font_path, size)
-                self.font_cache[cache_key] = font
-                self.available_font_path = font_path  # Cache working path
-                return font
-            except (OSError, IOError):
-                continue
+                try:
+                    font = self._open_font(self.available_font_path, size)
+                    self.font_cache[cache_key] = font
+                    return font
+                except (OSError, IOError):
+                    # Cached font path no longer works, clear it
+                    self.available_font_path = None
+
+            # Find and cache an available font path
+            for font_path in font_paths:
+                cache_key = (font_path, size)
+
+                # Check if already in cache
+                if cache_key in self.font_cache:
+                    self.available_font_path = font_path
+                    return self.font_cache[cache_key]
+
+                # Try to load this font
+                try:
+                    font = self._open_font(font_path, size)
+                    self.font_cache[cache_key] = font
+                    self.available_font_path = font_path  # Cache working path
+                    return font
+                except (OSError, IOError):
+                    continue
+
+            return None
+
+    def _cache_get(self, cache_key):
+        """Get an image from the LRU image cache, marking it most recently used"""
+        with self.image_cache_lock:
+            image = self.image_cache.get(cache_key)
+            if image is not None:
+                self.image_cache.move_to_end(cache_key)
+            return image
 
-        return None
+    def _cache_put(self, cache_key, image: bytes):
+        """Add an image to the LRU image cache, evicting the least recently used entry when full"""
+        with self.image_cache_lock:
+            self.image_cache[cache_key] = image
+            self.image_cache.move_to_end(cache_key)
+            if len(self.image_cache) > self.IMAGE_CACHE_SIZE:
+                self.image_cache.popitem(last=False)
 
     def _create_button_image(self, text: str, bg_color: str = 'black',
                             fg_color: str = '#7aa2f7', font_size='dynamic') -> bytes:
@@ -415,15 +587,14 @@ class StreamDeckManager:
             fg_color: Foreground/text color (hex or name)
             font_size: Font size in pixels, or 'dynamic' to auto-fit with padding
         """
-        # Check cache first (skip for dynamic size as text might vary)
-        if font_size != 'dynamic':
-            cache_key = (text, bg_color, fg_color, font_size)
-            if cache_key in self.image_cache:
-                return self.image_cache[cache_key]
+        # Check cache first; it is bounded, so dynamic labels like volume percentages are cached too
+        cache_key = (text, bg_color, fg_color, font_size)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         # Get the image size for this deck
-        image = Image.new('RGB', self.deck.key_image_format()['size'], bg_color)
-        draw = ImageDraw.Draw(image)
+        img_width, img_height = self._key_size
 
         # Use configured font paths
         font_paths = self.font_paths
@@ -432,7 +603,7 @@ class StreamDeckManager:
         if font_size == 'dynamic':
             # Start with a reasonable size and adjust down if needed
             target_font_size = self._calculate_dynamic_font_size(
-                text, image.width, image.height, font_paths, draw
+                text, img_width, img_height, font_paths, self._measure_draw
             )
         else:
             target_font_size = int(font_size)
@@ -445,27 +616,28 @@ class StreamDeckManager:
             font = ImageFont.load_default()
 
         # Get text bounding box for centering
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = self._measure_draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
         # Calculate position for centered text
         # Adjust for bbox offset to properly center the text
         position = (
-            (image.width - text_width) // 2 - bbox[0],
-            (image.height - text_height) // 2 - bbox[1]
+            (img_width - text_width) // 2 - bbox[0],
+            (img_height - text_height) // 2 - bbox[1]
         )
 
+        # Only the final image needs a framebuffer
+        image = Image.new('RGB', self._key_size, bg_color)
+        draw = ImageDraw.Draw(image)
+
         # Draw text with proper alignment for multi-line text
         draw.text(position, text, font=font, fill=fg_color, align='center')
 
         # Convert to format expected by Stream Deck
         result = PILHelper.to_native_format(self.deck, image)
 
-        # Cache the result for static images
-        if font_size != 'dynamic':
-            cache_key = (text, bg_color, fg_color, font_size)
-            self.image_cache[cache_key] = result
+        self._cache_put(cache_key, result)
 
         return result
 
@@ -488,49 +660,47 @@ class StreamDeckManager:
         max_width = img_width * (1 - 2 * horizontal_padding_ratio)
         max_height = img_height  # Use full height
 
-        # Start with a reasonable maximum and binary search for optimal size
         min_size = 8
         max_size = 50
-        optimal_size = min_size
+        reference_size = 20
 
         # Use cached font path if available, otherwise find one
         test_font_path = self.available_font_path
 
         if not test_font_path:
-            # Find an available font
-            for font_path in font_paths:
-                try:
-                    ImageFont.truetype(font_path, min_size)
-                    test_font_path = font_path
-                    self.available_font_path = font_path  # Cache it
-                    break
-                except (OSError, IOError):
-                    continue
+            # Find an available font; loading one caches its path
+            self._load_font_cached(font_paths, min_size)
+            test_font_path = self.available_font_path
 
         if test_font_path is None:
             # Can't load any font, return a safe default
             return 14
 
-        # Binary search for optimal font size
-        while min_size <= max_size:
-            mid_size = (min_size + max_size) // 2
-
-            # Use cached font loading
-            test_font = self._load_font_cached([test_font_path], mid_size)
-            if test_font is None:
+        def measure(size: int):
+            font = self._load_font_cached([test_font_path], size)
+            if font is None:
+                return None
+            bbox = draw.textbbox((0, 0), text, font=font)
+            return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+        # Text extent grows almost linearly with font size, so measure once at a
+        # reference size and scale, instead of binary searching over font loads
+        extent = measure(reference_size)
+        if extent is None:
+            return min_size
+        ref_width, ref_height = extent
+        if ref_width <= 0 or ref_height <= 0:
+            return max_size
+
+        scale = min(max_width / ref_width, max_height / ref_height)
+        optimal_size = max(min_size, min(max_size, int(reference_size * scale)))
+
+        # Hinting makes the scaling slightly inexact; step down until the text really fits
+        while optimal_size > min_size:
+            extent = measure(optimal_size)
+            if extent is None or (extent[0] <= max_width and extent[1] <= max_height):
                 break
-
-            bbox = draw.textbbox((0, 0), text, font=test_font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            if text_width <= max_width and text_height <= max_height:
-                # This size fits, try larger
-                optimal_size = mid_size
-                min_size = mid_size + 1
-            else:
-                # Too big, try smaller
-                max_size = mid_size - 1
+            optimal_size -= 1
 
         return optimal_size
 
@@ -542,7 +712,7 @@ class StreamDeckManager:
         # Use volume control module to update all volume buttons
         self.volume_control.update_volume_buttons(
             self.groups, self.group_pages, self.button_to_group,
-            self.deck, self._create_button_image
+            self.keys, self._create_button_image
         )
 
     def _watch_config_file(self):
@@ -557,7 +727,12 @@ class StreamDeckManager:
         logger.debug(f"Config watcher thread started (inotify), watching: {self.config_path}")
 
         inotify = INotify()
-        watch_flags = flags.MODIFY | flags.CLOSE_WRITE
+        # A finished write or an editor's rename-over-original, not every partial write
+        watch_flags = flags.CLOSE_WRITE | flags.MOVED_TO
+
+        # Sleep in the selector until inotify has events or _cleanup writes to the wake pipe
+        selector = selectors.DefaultSelector()
+        wake_read, self._config_watch_wake = os.pipe()
 
         try:
             # Watch the parent directory since editors often replace files
@@ -565,23 +740,52 @@ class StreamDeckManager:
             wd = inotify.add_watch(str(watch_dir), watch_flags)
             logger.debug(f"Added inotify watch on directory: {watch_dir}")
 
+            selector.register(inotify.fileno(), selectors.EVENT_READ)
+            selector.register(wake_read, selectors.EVENT_READ)
+
+            pending_reload_at = None
+
             while self.running:
-                # Wait for events with timeout to allow checking self.running
-                events = inotify.read(timeout=1000)
+                if pending_reload_at:
+                    timeout = max(0.0, pending_reload_at - time.monotonic())
+                else:
+                    timeout = 60
+                selector.select(timeout)
+                if not self.running:
+                    break
+
+                events = inotify.read(timeout=0)
 
-                for event in events:
-                    # Check if the event is for our config file
-                    if event.name == self.config_path.name:
-                        logger.info("Config file changed (inotify), attempting reload...")
-                        self._reload_config()
+                # Coalesce the burst of events from one save into a single reload
+                if any(event.name == self.config_path.name for event in events):
+                    pending_reload_at = time.monotonic() + self.CONFIG_RELOAD_DEBOUNCE
+                elif pending_reload_at and time.monotonic() >= pending_reload_at:
+                    pending_reload_at = None
+                    logger.info("Config file changed (inotify), attempting reload...")
+                    self._reload_config()
 
         except Exception as e:
             logger.error(f"Error in inotify config watcher: {e}")
             logger.info("Falling back to polling-based config watching")
             self._watch_config_file_polling()
         finally:
+            selector.close()
+            with self._config_watch_wake_lock:
+                wake_fd, self._config_watch_wake = self._config_watch_wake, None
+                os.close(wake_fd)
+            os.close(wake_read)
             inotify.close()
 
+    def _wake_config_watcher(self):
+        """Wake the inotify config watcher so it notices shutdown immediately"""
+        with self._config_watch_wake_lock:
+            wake_fd = self._config_watch_wake
+            if wake_fd is not None:
+                try:
+                    os.write(wake_fd, b'\0')
+                except OSError:
+                    pass
+
     def _watch_config_file_polling(self):
         """Watch config file using polling (fallback method)"""
         logger.debug(f"Config watcher thread started (polling), watching: {self.config_path}")
@@ -590,7 +794,7 @@ class StreamDeckManager:
             try:
                 if not self.config_path.exists():
                     logger.warning(f"Config file does not exist: {self.config_path}")
-                    time.sleep(1)
+                    self._stop_event.wait(1)
                     continue
 
                 current_mtime = self.config_path.stat().st_mtime
@@ -599,21 +803,67 @@ class StreamDeckManager:
                     logger.info("Config file changed (polling), attempting reload...")
                     self._reload_config()
 
-                time.sleep(1)  # Check every second
+                self._stop_event.wait(1)  # Check every second
             except Exception as e:
                 logger.error(f"Error in config watcher: {e}")
-                time.sleep(1)
+                self._stop_event.wait(1)
 
     def _reload_config(self):
-        """Reload config file and update all components"""
+        """Parse the changed config file and hand it to the reload worker"""
         # Small delay to ensure file write is complete
         time.sleep(0.1)
 
-        # Try to load the new config
         try:
-            new_config = ConfigLoader.load(self.config_path)
+            new_config = self._load_and_validate(self.config_path)
             current_mtime = self.config_path.stat().st_mtime
+        except Exception as e:
+            logger.error(f"Failed to reload config (keeping old config): {e}")
+            return
+
+        # Only the newest config is applied if several saves arrive during one bring-up
+        with self.config_lock:
+            self.config_last_modified = current_mtime
+            queued = self._pending_config is not None
+            self._pending_config = new_config
+        if not queued:
+            self._reload_pool.submit(self._bringup_integrations)
+
+    def _load_and_validate(self, config_path: Path) -> Dict[str, Any]:
+        """Load and validate a config file without touching any running state"""
+        return ConfigLoader.load(config_path)
+
+    def _swap_config(self, new_config: Dict[str, Any], action_handler: ActionHandler) -> bool:
+        """Point the manager at a new config and action handler
+
+        Returns:
+            False if the manager is shutting down and nothing was swapped
+        """
+        with self.config_lock:
+            if not self.running:
+                return False
+            self.config = new_config
+            self.action_handler = action_handler
+            self.groups = new_config['groups']
+        return True
+
+    def _disconnect_integrations(self, action_handler: ActionHandler):
+        """Disconnect the OBS and Home Assistant WebSockets owned by an action handler"""
+        if hasattr(action_handler, 'obs_control') and action_handler.obs_control:
+            logger.info("Disconnecting OBS WebSocket")
+            action_handler.obs_control.disconnect()
 
+        if hasattr(action_handler, 'ha_control') and action_handler.ha_control:
+            logger.info("Disconnecting Home Assistant WebSocket")
+            action_handler.ha_control.disconnect()
+
+    def _bringup_integrations(self):
+        """Reconnect integrations and redraw the deck for the newest pending config"""
+        with self.config_lock:
+            new_config, self._pending_config = self._pending_config, None
+        if new_config is None or not self.running:
+            return
+
+        try:
             # Disconnect old Home Assistant and OBS connections before creating new ones
             if hasattr(self.action_handler, 'ha_control') and self.action_handler.ha_control:
                 logger.info("Disconnecting old Home Assistant WebSocket before reload")
@@ -627,18 +877,18 @@ class StreamDeckManager:
                 # Give it a moment to fully disconnect
                 time.sleep(0.2)
 
-            # Config is valid, update
-            with self.config_lock:
-                self.config = new_config
-                self.config_last_modified = current_mtime
-                self.action_handler = ActionHandler(new_config)
-                self.groups = new_config['groups']
+            action_handler = ActionHandler(new_config, self.volume_control, self._scheduler)
+            if not self._swap_config(new_config, action_handler):
+                # Cleanup started while the handler connected, so it will never see this one
+                self._disconnect_integrations(action_handler)
+                return
 
             logger.info("Config reloaded successfully")
 
             # Set up OBS status callback for visual feedback
             if hasattr(self.action_handler, 'obs_control') and self.action_handler.obs_control:
-                self.action_handler.obs_control.add_status_callback(self._on_obs_status_change)
+                for kind in STATUS_KINDS:
+                    self.action_handler.obs_control.add_status_callback(kind, self._on_obs_status_change)
                 # Small delay to ensure OBS initial state is fetched
                 time.sleep(0.5)
 
@@ -655,13 +905,18 @@ class StreamDeckManager:
             self.deck.set_brightness(brightness)
             logger.debug(f"Brightness updated to {brightness}")
 
-            # Update font paths if changed
-            self.font_paths = self._get_font_paths()
-
-            # Clear caches on config reload
-            self.font_cache.clear()
-            self.image_cache.clear()
-            self.available_font_path = None  # Clear cached font path
+            # Update font paths if changed; loaded fonts and rendered images stay valid otherwise
+            new_font_paths = self._get_font_paths()
+            if new_font_paths != self.font_paths:
+                self.font_paths = new_font_paths
+                with self.font_cache_lock:
+                    self.font_cache.clear()
+                    self._base_fonts.clear()
+                    self.available_font_path = None  # Clear cached font path
+                with self.image_cache_lock:
+                    self.image_cache.clear()
+            else:
+                self._invalidate_stale_images(new_config)
 
             # Reinitialize buttons with new config
             self._initialize_buttons()
@@ -675,28 +930,46 @@ class StreamDeckManager:
                 self._on_ha_status_change()
 
         except Exception as e:
-            logger.error(f"Failed to reload config (keeping old config): {e}")
+            logger.error(f"Failed to apply reloaded config: {e}")
+
+    def _invalidate_stale_images(self, config: Dict[str, Any]):
+        """Drop cached images whose background and font size no longer occur in the config
+
+        Foreground colors come from live OBS/Home Assistant/volume state rather than the config,
+        so only the group background and button font size are compared.
+        """
+        live_styles = {('black', 'dynamic')}  # Used for blank and cleared buttons
+        for group_config in config.get('groups', {}).values():
+            bg_color = group_config.get('bg_color', 'black')
+            for page_config in group_config.get('pages', {}).values():
+                for button_config in page_config.get('buttons', {}).values():
+                    font_size = button_config.get('font_size', 'dynamic')
+                    # Home Assistant and DLZ buttons always render on black
+                    live_styles.add((bg_color, font_size))
+                    live_styles.add(('black', font_size))
+
+        with self.image_cache_lock:
+            stale = [key for key in self.image_cache if (key[1], key[3]) not in live_styles]
+            for key in stale:
+                del self.image_cache[key]
+        logger.debug(f"Dropped {len(stale)} cached button image(s) after config reload")
 
     def _key_change_callback(self, deck, key, state):
         """Handle button press/release events"""
         logger.debug(f"Key callback: key={key} (type={type(key).__name__}), state={state}")
 
         # Find which group this button belongs to
-        group_name = self.button_to_group.get(key)
+        group_name = self._btn_group[key] if key < len(self._btn_group) else None
         if not group_name:
             logger.warning(f"Button {key} not assigned to any group")
             return
 
         # Get the current page for this group
         page_num = self.group_pages.get(group_name, 0)
-        group_config = self.groups[group_name]
-        pages = group_config.get('pages', {})
-        page_config = pages.get(page_num, {})
-        buttons = page_config.get('buttons', {})
-
-        logger.debug(f"Button {key} in group '{group_name}', page {page_num}, buttons: {list(buttons.keys())}")
+        buttons = self._page_buttons.get((group_name, page_num))
+        button_config = buttons[key] if buttons else None
 
-        button_config = buttons.get(str(key))
+        logger.debug(f"Button {key} in group '{group_name}', page {page_num}")
 
         if not button_config:
             logger.warning(f"No action configured for button {key}")
@@ -708,22 +981,13 @@ class StreamDeckManager:
 
             # Handle page_switch specially
             if button_config.get('type') == 'page_switch':
-                # Start a timer - if held for 500ms, go to page 0 instead
+                # If held for 500ms, go to page 0 instead
                 def go_to_page_0():
                     logger.info(f"Page switch button {key} held for 500ms - going to page 0")
                     self.switch_page(group_name, 0)
-                    # Mark that we went to page 0 so we don't also switch on release
-                    self.page_switch_timers[key] = 'triggered'
-
-                # Cancel any existing timer for this button
-                if key in self.page_switch_timers and isinstance(self.page_switch_timers[key], threading.Timer):
-                    self.page_switch_timers[key].cancel()
-
-                # Start new timer for hold-to-home
-                timer = threading.Timer(0.5, go_to_page_0)
-                timer.daemon = True
-                timer.start()
-                self.page_switch_timers[key] = timer
+
+                # Replaces any pending hold for this button
+                self._scheduler.schedule(key, 0.5, go_to_page_0)
             else:
                 self.action_handler.handle_press(key, button_config)
         else:
@@ -731,41 +995,31 @@ class StreamDeckManager:
             button_type = button_config.get('type')
 
             if button_type == 'page_switch':
-                # Cancel the timer if still running
-                if key in self.page_switch_timers:
-                    timer_or_flag = self.page_switch_timers[key]
-
-                    if isinstance(timer_or_flag, threading.Timer):
-                        # Timer still running - cancel it and do normal page switch
-                        timer_or_flag.cancel()
-                        target_page = button_config.get('page', 0)
-                        target_group = button_config.get('group', self.button_to_group.get(key))
-                        self.switch_page(target_group, target_page)
-                    # else: timer already triggered (went to page 0), don't switch again
-
-                    # Clean up
-                    del self.page_switch_timers[key]
+                # Released before the hold fired - do normal page switch
+                # (if it already fired we went to page 0, don't switch again)
+                if self._scheduler.cancel(key):
+                    target_page = button_config.get('page', 0)
+                    target_group = button_config.get('group', group_name)
+                    self.switch_page(target_group, target_page)
             else:
                 self.action_handler.handle_release(key, button_config)
 
     def _cleanup(self):
         """Clean up Stream Deck connection and resources"""
-        self.running = False
+        self.stop()
+        self._scheduler.stop()
+        self._render_pool.shutdown(wait=False)
+        self._reload_pool.shutdown(wait=False)
 
         # Stop volume monitoring
         if self.volume_control:
             logger.info("Stopping volume monitoring")
             self.volume_control.stop_monitoring()
 
-        # Disconnect OBS WebSocket
-        if hasattr(self.action_handler, 'obs_control') and self.action_handler.obs_control:
-            logger.info("Disconnecting OBS WebSocket")
-            self.action_handler.obs_control.disconnect()
-
-        # Disconnect Home Assistant WebSocket
-        if hasattr(self.action_handler, 'ha_control') and self.action_handler.ha_control:
-            logger.info("Disconnecting Home Assistant WebSocket")
-            self.action_handler.ha_control.disconnect()
+        # Read the handler under the lock so a reload can't swap in a new one after this point
+        with self.config_lock:
+            action_handler = self.action_handler
+        self._disconnect_integrations(action_handler)
 
         # Close Stream Deck
         if self.deck:
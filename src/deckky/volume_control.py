@@ -2,14 +2,33 @@
 
 import subprocess
 import logging
+import os
+import random
 import re
+import select
+import shutil
+import signal
 import threading
+import time
 from functools import wraps
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from deckky.button_utils import update_buttons_for_type
 
 logger = logging.getLogger(__name__)
 
+# Talk to the PulseAudio/Pipewire server directly when pulsectl is installed, otherwise shell out to pactl
+try:
+    import pulsectl
+    PULSECTL_AVAILABLE = True
+except ImportError:
+    PULSECTL_AVAILABLE = False
+
+# First percentage in `pactl get-sink-volume` output
+_VOL_RE = re.compile(rb'(\d+)%')
+
+# `pactl subscribe` lines for sink changes and default sink switches, e.g. "Event 'change' on sink #47"
+_SINK_CHANGE_RE = re.compile(rb"'change' on (?:sink|server) ")
+
 
 def require_available(default_return=None):
     """Decorator to check if volume control is available before executing method"""
@@ -25,48 +44,84 @@ def require_available(default_return=None):
 
 
 class VolumeControl:
-    """Handles volume control via pactl (Pipewire/PulseAudio)"""
+    """Handles volume control via pulsectl or pactl (Pipewire/PulseAudio)"""
+
+    # One volume key tick emits several sink change events; notify once per window
+    NOTIFY_COALESCE_DELAY = 0.1
+    # Monitor restart backoff after the audio server or pactl goes away (seconds)
+    RESTART_DELAY = 2
+    MAX_RESTART_DELAY = 30
 
     def __init__(self):
-        if not self._check_pactl():
+        self._pulse = None  # pulsectl connection for queries and commands (None when using pactl)
+        self._pulse_lock = threading.Lock()  # pulsectl connections aren't thread-safe
+        self._pulse_closed = False  # Set under _pulse_lock by stop_monitoring; no reconnects after that
+
+        if PULSECTL_AVAILABLE:
+            try:
+                self._pulse = pulsectl.Pulse('deckky')
+            except Exception as e:
+                logger.warning(f"Could not connect to PulseAudio via pulsectl, falling back to pactl: {e}")
+
+        if self._pulse is not None:
+            self.available = True
+            logger.info("Volume control initialized (pulsectl)")
+        elif not self._check_pactl():
             logger.warning("pactl not found - volume control will not work")
             self.available = False
         else:
             self.available = True
             logger.info("Volume control initialized (pactl)")
 
-        self.change_callbacks = []
+        self.change_callbacks = ()  # Replaced, never mutated, so the notifier iterates it without locking
+        self._callbacks_lock = threading.Lock()
         self.monitoring = False
         self.monitor_thread = None
+        self.notify_thread = None
+        self._dirty = threading.Event()  # Set when a change event is waiting to be delivered
+        self._stop_event = threading.Event()  # Set by stop_monitoring to interrupt restart backoff
+        self._subscribe_process = None  # Running `pactl subscribe`, so stop_monitoring can end it
+        self._monitor_pulse = None  # pulsectl connection the monitor is listening on
+        self._cached = (0, False)  # Default sink (volume, muted), replaced as a whole on change events
 
         if self.available:
             self._start_monitoring()
 
     def _check_pactl(self) -> bool:
-        """Check if pactl is available"""
-        try:
-            subprocess.run(['pactl', '--version'], capture_output=True, check=True)
-            return True
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            return False
-
-    def _get_default_sink(self) -> str:
-        """Get the default audio sink"""
-        try:
-            result = subprocess.run(
-                ['pactl', 'get-default-sink'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get default sink: {e}")
-            return ""
+        """Check if pactl is available on PATH"""
+        return shutil.which('pactl') is not None
+
+    def _pulse_call(self, operation: Callable):
+        """Run operation(pulse) on the pulsectl connection, reconnecting once if the server went away"""
+        with self._pulse_lock:
+            if self._pulse_closed:
+                raise pulsectl.PulseDisconnected("pulsectl connection closed")
+            try:
+                return operation(self._pulse)
+            except pulsectl.PulseDisconnected:
+                logger.info("PulseAudio connection lost, reconnecting")
+                self._pulse.close()
+                # Only replace the closed connection once the new one is up
+                pulse = pulsectl.Pulse('deckky')
+                self._pulse = pulse
+                return operation(pulse)
+
+    @staticmethod
+    def _pulse_default_sink(pulse):
+        """Get the default sink object from a pulsectl connection"""
+        return pulse.get_sink_by_name(pulse.server_info().default_sink_name)
 
     @require_available()
     def increase(self, amount: int = 5):
         """Increase volume by percentage"""
+        if self._pulse is not None:
+            try:
+                self._pulse_call(lambda pulse: pulse.volume_change_all_chans(self._pulse_default_sink(pulse), amount / 100))
+                logger.debug(f"Increased volume by {amount}%")
+            except pulsectl.PulseError as e:
+                logger.error(f"Failed to increase volume: {e}")
+            return
+
         try:
             subprocess.run(
                 ['pactl', 'set-sink-volume', '@DEFAULT_SINK@', f'+{amount}%'],
@@ -79,6 +134,14 @@ class VolumeControl:
     @require_available()
     def decrease(self, amount: int = 5):
         """Decrease volume by percentage"""
+        if self._pulse is not None:
+            try:
+                self._pulse_call(lambda pulse: pulse.volume_change_all_chans(self._pulse_default_sink(pulse), -amount / 100))
+                logger.debug(f"Decreased volume by {amount}%")
+            except pulsectl.PulseError as e:
+                logger.error(f"Failed to decrease volume: {e}")
+            return
+
         try:
             subprocess.run(
                 ['pactl', 'set-sink-volume', '@DEFAULT_SINK@', f'-{amount}%'],
@@ -91,6 +154,17 @@ class VolumeControl:
     @require_available()
     def mute_toggle(self):
         """Toggle mute state"""
+        if self._pulse is not None:
+            def toggle(pulse):
+                sink = self._pulse_default_sink(pulse)
+                pulse.mute(sink, not sink.mute)
+            try:
+                self._pulse_call(toggle)
+                logger.debug("Toggled mute")
+            except pulsectl.PulseError as e:
+                logger.error(f"Failed to toggle mute: {e}")
+            return
+
         try:
             subprocess.run(
                 ['pactl', 'set-sink-mute', '@DEFAULT_SINK@', 'toggle'],
@@ -102,34 +176,59 @@ class VolumeControl:
 
     @require_available(default_return=0)
     def get_volume(self) -> int:
-        """Get current volume percentage"""
-        sink = self._get_default_sink()
-        if not sink:
-            return 0
+        """Get current volume percentage (cached, refreshed on sink change events)"""
+        return self._cached[0]
+
+    def _refresh_state(self):
+        """Query the default sink's volume and mute state once and cache them"""
+        if self._pulse is not None:
+            try:
+                sink = self._pulse_call(self._pulse_default_sink)
+            except pulsectl.PulseError as e:
+                logger.error(f"Failed to get volume state: {e}")
+                return
+            self._cached = (int(round(sink.volume.value_flat * 100)), bool(sink.mute))
+        else:
+            state = self._query_state()
+            if state is not None:  # Keep showing the last known state if pactl couldn't run
+                self._cached = state
 
+    def _query_state(self) -> Optional[Tuple[int, bool]]:
+        """Get the default sink's (volume, muted) from pactl, or None if pactl couldn't be run"""
         try:
-            result = subprocess.run(
-                ['pactl', 'get-sink-volume', sink],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            volume_proc = subprocess.Popen(['pactl', 'get-sink-volume', '@DEFAULT_SINK@'],
+                                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            mute_proc = subprocess.Popen(['pactl', 'get-sink-mute', '@DEFAULT_SINK@'],
+                                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            volume_out, _ = volume_proc.communicate()
+            mute_out, _ = mute_proc.communicate()
+        except OSError as e:
+            logger.error(f"Failed to get volume state: {e}")
+            return None
+
+        volume = 0
+        match = _VOL_RE.search(volume_out) if volume_proc.returncode == 0 else None
+        if match:
+            volume = int(match.group(1))
+        else:
+            logger.error(f"Failed to get volume (pactl exit code {volume_proc.returncode})")
 
-            match = re.search(r'(\d+)%', result.stdout)
-            if match:
-                return int(match.group(1))
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get volume: {e}")
+        if mute_proc.returncode != 0:
+            logger.error(f"Failed to get mute state (pactl exit code {mute_proc.returncode})")
+
+        return volume, b'yes' in mute_out.lower()
 
-        return 0
+    def setup_volume_button(self, button_config: dict, create_image_callback, bg_color: str = 'black',
+                            state: Optional[Tuple[int, bool]] = None) -> bytes:
+        """Setup volume button with visual feedback. Returns button image bytes.
 
-    def setup_volume_button(self, button_config: dict, create_image_callback, bg_color: str = 'black') -> bytes:
-        """Setup volume button with visual feedback. Returns button image bytes."""
+        Args:
+            state: (volume, is_muted) snapshot to draw from; read from the cache when omitted
+        """
         action = button_config.get('action')
 
         if action == 'display':
-            volume = self.get_volume()
-            is_muted = self.is_muted()
+            volume, is_muted = state if state is not None else (self.get_volume(), self.is_muted())
 
             if is_muted:
                 label = f"Vol\nMuted"
@@ -151,32 +250,18 @@ class VolumeControl:
 
     @require_available(default_return=False)
     def is_muted(self) -> bool:
-        """Check if audio is muted"""
-        sink = self._get_default_sink()
-        if not sink:
-            return False
-
-        try:
-            result = subprocess.run(
-                ['pactl', 'get-sink-mute', sink],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            return 'yes' in result.stdout.lower()
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get mute state: {e}")
-
-        return False
+        """Check if audio is muted (cached, refreshed on sink change events)"""
+        return self._cached[1]
 
     def update_volume_buttons(self, groups: dict, group_pages: dict, button_to_group: dict,
                               deck, create_image_callback):
         """Update all volume display buttons"""
+        # Every display button shows the same state, so read it once per pass
+        state = (self.get_volume(), self.is_muted())
         updated = update_buttons_for_type(
             groups, group_pages, button_to_group,
             deck, create_image_callback, 'volume',
-            lambda config, cb, bg: self.setup_volume_button(config, cb, bg) 
+            lambda config, cb, bg: self.setup_volume_button(config, cb, bg, state)
                 if config.get('action') == 'display' else None
         )
         if updated > 0:
@@ -184,83 +269,190 @@ class VolumeControl:
 
     def add_change_callback(self, callback: Callable[[], None]):
         """Add a callback to be called when volume or mute state changes"""
-        self.change_callbacks.append(callback)
+        with self._callbacks_lock:
+            self.change_callbacks = self.change_callbacks + (callback,)
 
     def _notify_callbacks(self):
         """Notify all registered callbacks of volume changes"""
-        for callback in self.change_callbacks:
+        for callback in self.change_callbacks:  # Tuple snapshot; additions swap in a new tuple
             try:
                 callback()
             except Exception as e:
                 logger.error(f"Error in volume change callback: {e}")
 
+    def _notify_worker(self):
+        """Notify callbacks once for each burst of change events"""
+        while self.monitoring:
+            self._dirty.wait()
+            if not self.monitoring:
+                break
+
+            # Let the rest of the burst arrive before redrawing
+            time.sleep(self.NOTIFY_COALESCE_DELAY)
+            self._dirty.clear()
+            self._refresh_state()
+            self._notify_callbacks()
+
     def _start_monitoring(self):
-        """Start monitoring volume changes via pactl subscribe"""
+        """Start monitoring volume changes via pulsectl events or pactl subscribe"""
         if not self.available:
             return
 
+        self._refresh_state()
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_volume, daemon=True)
-        self.monitor_thread.start()
-        logger.debug("Started volume monitoring via pactl subscribe")
+        self.notify_thread = threading.Thread(target=self._notify_worker, daemon=True)
+        self.notify_thread.start()
+        if self._pulse is not None:
+            self.monitor_thread = threading.Thread(target=self._monitor_volume_pulse, daemon=True)
+            self.monitor_thread.start()
+            logger.debug("Started volume monitoring via pulsectl events")
+        else:
+            self.monitor_thread = threading.Thread(target=self._monitor_volume, daemon=True)
+            self.monitor_thread.start()
+            logger.debug("Started volume monitoring via pactl subscribe")
+
+    def _monitor_volume_pulse(self):
+        """Monitor sink changes using PulseAudio events on a dedicated pulsectl connection"""
+        changed = False
+
+        def on_event(event):
+            nonlocal changed
+            if event.t == pulsectl.PulseEventTypeEnum.change:
+                # Callbacks can't run inside the event loop, so stop listening and notify below
+                changed = True
+                raise pulsectl.PulseLoopStop
+
+        failures = 0
+        while self.monitoring:
+            try:
+                with pulsectl.Pulse('deckky-monitor') as pulse:
+                    self._monitor_pulse = pulse
+                    pulse.event_mask_set('sink', 'server')
+                    pulse.event_callback_set(on_event)
+                    failures = 0
+                    # Changes may have been missed while not listening
+                    self._dirty.set()
+
+                    while self.monitoring:
+                        # Returns early when on_event stops the loop, otherwise wakes to check for shutdown
+                        pulse.event_listen(timeout=0.5)
+                        if changed:
+                            changed = False
+                            logger.debug("Volume change detected (pulsectl)")
+                            self._dirty.set()
+
+            except Exception as e:
+                logger.error(f"Error in volume monitoring: {e}")
+            finally:
+                self._monitor_pulse = None
+
+            if self.monitoring:
+                self._wait_before_restart(failures)
+                failures += 1
 
     def _monitor_volume(self):
         """Monitor volume changes using pactl subscribe"""
         process = None
+        failures = 0
 
         while self.monitoring:
             try:
+                # Own process group so stop_monitoring can signal it without touching deckky
                 process = subprocess.Popen(
                     ['pactl', 'subscribe'],
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
                 )
+                self._subscribe_process = process
+
+                logger.debug("Started pactl subscribe process (PID: %s)", process.pid)
+                # Changes may have been missed while not subscribed
+                self._dirty.set()
 
-                logger.debug(f"Started pactl subscribe process (PID: {process.pid})")
+                # Non-blocking reads with a select timeout so shutdown is noticed while idle
+                fd = process.stdout.fileno()
+                os.set_blocking(fd, False)
+                pending = b''
 
-                for line in process.stdout:
-                    if not self.monitoring:
-                        logger.debug("Monitoring stopped, terminating pactl process")
+                while self.monitoring:
+                    ready, _, _ = select.select([fd], [], [], 0.5)
+                    if not ready:
+                        continue
+
+                    data = os.read(fd, 4096)
+                    if not data:
+                        logger.debug("pactl subscribe exited")
                         break
+                    failures = 0
+
+                    # Keep a trailing partial line for the next read
+                    *lines, pending = (pending + data).split(b'\n')
+                    for line in lines:
+                        if _SINK_CHANGE_RE.search(line):
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Volume change detected: %s", line.strip().decode(errors='replace'))
+                            self._dirty.set()
 
-                    if 'sink' in line.lower() and 'change' in line.lower():
-                        logger.debug(f"Volume change detected: {line.strip()}")
-                        self._notify_callbacks()
+                if not self.monitoring:
+                    logger.debug("Monitoring stopped, terminating pactl process")
 
             except Exception as e:
                 logger.error(f"Error in volume monitoring: {e}")
             finally:
-                if process and process.poll() is None:
-                    try:
-                        process.terminate()
-                        import time
-                        time.sleep(0.1)
-
-                        if process.poll() is None:
-                            process.kill()
-                            logger.debug("Force killed pactl subscribe process")
-
-                        process.wait(timeout=1)
-                    except Exception as cleanup_error:
-                        logger.error(f"Error cleaning up pactl process: {cleanup_error}")
-
                 if process:
-                    try:
-                        process.wait(timeout=0.5)
-                        logger.debug(f"pactl subscribe process (PID: {process.pid}) terminated successfully")
-                    except:
-                        pass
+                    if process.poll() is None:
+                        self._kill_process_group(process, signal.SIGTERM)
+                        try:
+                            process.wait(timeout=1)
+                        except subprocess.TimeoutExpired:
+                            self._kill_process_group(process, signal.SIGKILL)
+                            process.wait()
+                            logger.debug("Force killed pactl subscribe process")
+                    process.stdout.close()
+                    logger.debug("pactl subscribe process (PID: %s) terminated", process.pid)
+                    self._subscribe_process = None
                     process = None
 
                 if self.monitoring:
-                    import time
-                    time.sleep(2)
-                    logger.debug("Restarting volume monitoring")
+                    self._wait_before_restart(failures)
+                    failures += 1
+
+    def _wait_before_restart(self, failures: int):
+        """Wait before restarting the monitor, backing off exponentially with jitter; returns early on stop"""
+        delay = min(self.MAX_RESTART_DELAY, self.RESTART_DELAY * (2 ** failures))
+        delay *= 0.5 + random.random()
+        logger.debug(f"Restarting volume monitoring in {delay:.1f} seconds")
+        self._stop_event.wait(delay)
+
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen, sig: int):
+        """Signal a subprocess started in its own session, ignoring one that already exited"""
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
 
     def stop_monitoring(self):
         """Stop volume monitoring"""
         self.monitoring = False
+        self._stop_event.set()
+        self._dirty.set()  # Wake the notify worker so it exits
+
+        # End the monitor's blocking wait right away: pactl's exit gives the reader EOF
+        process = self._subscribe_process
+        if process is not None and process.poll() is None:
+            self._kill_process_group(process, signal.SIGTERM)
+        pulse = self._monitor_pulse
+        if pulse is not None:
+            pulse.event_listen_stop()
+
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
+        # The notify worker may be mid-refresh; let it finish before the connection goes away
+        if self.notify_thread:
+            self.notify_thread.join(timeout=2)
+        if self._pulse is not None:
+            with self._pulse_lock:
+                self._pulse_closed = True
+                self._pulse.close()